@@ -0,0 +1,46 @@
+"""JSON helpers with an optional orjson accelerator.
+
+orjson (install with ``pip install context-harness[orjson]``) parses and
+serializes several times faster than the stdlib. When it is not installed
+these helpers fall back to the stdlib ``json`` module, so callers never
+need to care which backend is active.
+
+Both backends raise a ``ValueError`` subclass on malformed input, so
+callers should catch ``ValueError`` rather than ``json.JSONDecodeError``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON from a bytes buffer."""
+        return orjson.loads(data)
+
+    def dumps_indented(obj: Any) -> bytes:
+        """Serialize to 2-space-indented JSON bytes with a trailing newline."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+
+    def dumps_compact(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes (no whitespace)."""
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON from a bytes buffer."""
+        return json.loads(data)
+
+    def dumps_indented(obj: Any) -> bytes:
+        """Serialize to 2-space-indented JSON bytes with a trailing newline."""
+        return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+    def dumps_compact(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes (no whitespace)."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
@@ -1,10 +1,8 @@
 """CLI entry point for ContextHarness."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
 
 from context_harness import __version__
 from context_harness.installer import install_framework, InstallResult
@@ -42,7 +40,37 @@ from context_harness.completion import (
 )
 from context_harness.interfaces.cli.worktree_cmd import worktree_group
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich is imported lazily so `context-harness --help` and friends don't pay
+# the rich startup cost before printing anything.
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Get the shared console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def _print_banner(title: str) -> None:
+    """Print the standard CLI banner panel."""
+    from rich.panel import Panel
+
+    console = _get_console()
+    console.print()
+    console.print(
+        Panel.fit(
+            f"[bold blue]ContextHarness[/bold blue] {title}",
+            subtitle=f"v{__version__}",
+        )
+    )
+    console.print()
 
 
 @click.group()
@@ -98,14 +126,8 @@ def init(force: bool, target: str, tool: str):
 
         context-harness init --force --tool both
     """
-    console.print()
-    console.print(
-        Panel.fit(
-            "[bold blue]ContextHarness[/bold blue] Installer",
-            subtitle=f"v{__version__}",
-        )
-    )
-    console.print()
+    console = _get_console()
+    _print_banner("Installer")
 
     # Show what will be installed
     if tool == "both":
@@ -204,14 +226,8 @@ def mcp_add(server: str | None, api_key: str, target: str):
 
         context-harness mcp add context7 --target ./my-project
     """
-    console.print()
-    console.print(
-        Panel.fit(
-            "[bold blue]ContextHarness[/bold blue] MCP Configuration",
-            subtitle=f"v{__version__}",
-        )
-    )
-    console.print()
+    console = _get_console()
+    _print_banner("MCP Configuration")
 
     # If no server provided, show interactive picker
     if server is None:
@@ -257,6 +273,7 @@ def mcp_list(target: str):
 
         context-harness mcp list --target ./my-project
     """
+    console = _get_console()
     console.print()
     list_mcp_servers(target=target)
     console.print()
@@ -302,14 +319,8 @@ def mcp_auth(server: str, client_id: str, status: bool, logout: bool):
 
         context-harness mcp auth atlassian --logout
     """
-    console.print()
-    console.print(
-        Panel.fit(
-            "[bold blue]ContextHarness[/bold blue] MCP Authentication",
-            subtitle=f"v{__version__}",
-        )
-    )
-    console.print()
+    console = _get_console()
+    _print_banner("MCP Authentication")
 
     # Validate server supports OAuth
     server_info = get_mcp_server_info(server)
@@ -346,6 +357,7 @@ def _handle_oauth_auth(
     server: str, client_id: Optional[str], status: bool, logout: bool
 ) -> None:
     """Handle generic OAuth authentication for any MCP server."""
+    console = _get_console()
     try:
         oauth = get_oauth_flow(server, client_id)
     except OAuthError as e:
@@ -457,6 +469,7 @@ def _handle_atlassian_auth(
 
 def _print_mcp_usage_tips(server: str) -> None:
     """Print usage tips for the configured MCP server."""
+    console = _get_console()
     if server == "context7":
         console.print()
         console.print("[dim]Context7 provides documentation lookup capabilities.[/dim]")
@@ -524,6 +537,7 @@ def config_get(key: str):
 
         context-harness config get skills-repo
     """
+    console = _get_console()
     if key == "skills-repo":
         result = get_skills_repo_info()
         if isinstance(result, Failure):
@@ -640,6 +654,7 @@ def config_set(key: str, value: str, scope: str):
 
         context-harness config set skills-repo my-org/my-skills --project
     """
+    console = _get_console()
     if key == "skills-repo":
         # Parse and normalize repo value (accepts owner/repo or full GitHub URL)
         repo = _parse_repo_value(value)
@@ -664,6 +679,7 @@ def config_set(key: str, value: str, scope: str):
 
 def _set_user_skills_repo(repo: str) -> None:
     """Set skills repo in user config."""
+    console = _get_console()
     service = UserConfigService()
 
     # Load existing config
@@ -691,6 +707,7 @@ def _set_user_skills_repo(repo: str) -> None:
 
 def _set_project_skills_repo(repo: str) -> None:
     """Set skills repo in project config."""
+    console = _get_console()
     service = ConfigService()
 
     # Load or create config
@@ -713,7 +730,7 @@ def _set_project_skills_repo(repo: str) -> None:
         skills=config.skills,
         skills_registry=SkillsRegistryConfig(default=repo),
         project_context=config.project_context,
-        raw_data=config.raw_data,
+        unknown=config.unknown,
     )
 
     # Save
@@ -738,16 +755,10 @@ def config_list():
 
         context-harness config list
     """
+    console = _get_console()
     from pathlib import Path
 
-    console.print()
-    console.print(
-        Panel.fit(
-            "[bold blue]ContextHarness[/bold blue] Configuration",
-            subtitle=f"v{__version__}",
-        )
-    )
-    console.print()
+    _print_banner("Configuration")
 
     # Skills repo
     result = get_skills_repo_info()
@@ -807,6 +818,7 @@ def config_unset(key: str, scope: str):
 
         context-harness config unset skills-repo --user
     """
+    console = _get_console()
     if key == "skills-repo":
         if scope == "user":
             _unset_user_skills_repo()
@@ -821,6 +833,7 @@ def config_unset(key: str, scope: str):
 
 def _unset_user_skills_repo() -> None:
     """Remove skills repo from user config."""
+    console = _get_console()
     service = UserConfigService()
 
     if not service.exists():
@@ -847,6 +860,7 @@ def _unset_user_skills_repo() -> None:
 
 def _unset_project_skills_repo() -> None:
     """Remove skills repo from project config."""
+    console = _get_console()
     service = ConfigService()
 
     if not service.exists():
@@ -871,7 +885,7 @@ def _unset_project_skills_repo() -> None:
         skills=config.skills,
         skills_registry=None,
         project_context=config.project_context,
-        raw_data=config.raw_data,
+        unknown=config.unknown,
     )
 
     save_result = service.save(new_config)
@@ -3,11 +3,24 @@
 import shutil
 from enum import Enum
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, Optional
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+# rich is imported lazily so importing the installer doesn't pay the rich
+# startup cost before anything is printed.
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Get the shared console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 class InstallResult(Enum):
@@ -118,6 +131,7 @@ def validate_templates(
             missing.append(file_path)
 
     if missing and not quiet:
+        console = _get_console()
         console.print("[red]Error: Bundled templates are incomplete.[/red]")
         console.print("[red]Missing files:[/red]")
         for f in missing:
@@ -143,6 +157,7 @@ def install_framework(
     Returns:
         InstallResult indicating success or failure reason
     """
+    console = _get_console()
     target_path = Path(target).resolve()
     templates_dir = get_templates_dir()
 
@@ -286,6 +301,7 @@ def install_framework(
 
 def _show_upgrade_message(target_path: Path, tool_target: TargetType) -> None:
     """Show message about what will be created vs updated."""
+    console = _get_console()
     opencode_exists = (target_path / ".opencode").exists()
     claude_exists = (target_path / ".claude").exists()
 
@@ -421,6 +437,7 @@ def _copy_preserving_user_skills(source: Path, target: Path, force: bool) -> Non
 
 def _print_created_files(target_path: Path, tool_target: TargetType = "both") -> None:
     """Print a tree of created files."""
+    console = _get_console()
     console.print("[bold]Created files:[/bold]")
 
     # Show root-level files
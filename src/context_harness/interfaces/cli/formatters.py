@@ -8,21 +8,30 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
 from context_harness import __version__
 
 if TYPE_CHECKING:
+    from rich.console import Console
+
     from context_harness.primitives import (
         MCPServer,
         OpenCodeConfig,
         Skill,
     )
 
-# Shared console instance
-console = Console()
+# rich is imported lazily so command modules that import the formatters
+# don't pay the rich startup cost until something is actually printed.
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """Get the shared console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def print_header(title: str, subtitle: Optional[str] = None) -> None:
@@ -32,6 +41,9 @@ def print_header(title: str, subtitle: Optional[str] = None) -> None:
         title: Main title text
         subtitle: Optional subtitle (defaults to version)
     """
+    from rich.panel import Panel
+
+    console = get_console()
     console.print()
     console.print(
         Panel.fit(
@@ -44,27 +56,27 @@ def print_header(title: str, subtitle: Optional[str] = None) -> None:
 
 def print_success(message: str) -> None:
     """Print a success message with checkmark."""
-    console.print(f"[green]✅ {message}[/green]")
+    get_console().print(f"[green]✅ {message}[/green]")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[yellow]⚠️  {message}[/yellow]")
+    get_console().print(f"[yellow]⚠️  {message}[/yellow]")
 
 
 def print_error(message: str) -> None:
     """Print an error message with X."""
-    console.print(f"[red]❌ {message}[/red]")
+    get_console().print(f"[red]❌ {message}[/red]")
 
 
 def print_info(message: str) -> None:
     """Print an informational message (dimmed)."""
-    console.print(f"[dim]{message}[/dim]")
+    get_console().print(f"[dim]{message}[/dim]")
 
 
 def print_bold(message: str) -> None:
     """Print bold text."""
-    console.print(f"[bold]{message}[/bold]")
+    get_console().print(f"[bold]{message}[/bold]")
 
 
 def print_next_steps(steps: List[str]) -> None:
@@ -73,6 +85,7 @@ def print_next_steps(steps: List[str]) -> None:
     Args:
         steps: List of step descriptions
     """
+    console = get_console()
     console.print()
     console.print("[bold]Next steps:[/bold]")
     for i, step in enumerate(steps, 1):
@@ -86,6 +99,9 @@ def print_skill_table(skills: List["Skill"]) -> None:
     Args:
         skills: List of Skill objects to display
     """
+    from rich.table import Table
+
+    console = get_console()
     if not skills:
         console.print("[dim]No skills found.[/dim]")
         return
@@ -116,6 +132,9 @@ def print_mcp_server_table(servers: List["MCPServer"]) -> None:
     Args:
         servers: List of MCPServer objects to display
     """
+    from rich.table import Table
+
+    console = get_console()
     if not servers:
         console.print("[dim]No MCP servers found.[/dim]")
         return
@@ -143,6 +162,9 @@ def print_configured_servers(config: "OpenCodeConfig") -> None:
     Args:
         config: OpenCodeConfig with mcpServers
     """
+    from rich.table import Table
+
+    console = get_console()
     if not config.mcpServers:
         console.print("[dim]No MCP servers configured.[/dim]")
         console.print("[dim]Use 'context-harness mcp add <server>' to add one.[/dim]")
@@ -166,6 +188,7 @@ def print_mcp_usage_tips(server_name: str) -> None:
     Args:
         server_name: Name of the server
     """
+    console = get_console()
     if server_name == "context7":
         console.print()
         print_info("Context7 provides documentation lookup capabilities.")
@@ -206,6 +229,7 @@ def print_oauth_setup_instructions(
     if not setup_url:
         return
 
+    console = get_console()
     console.print()
     print_bold(f"To get a {display_name} OAuth client ID:")
     console.print(f"  1. Go to {setup_url}")
@@ -9,7 +9,7 @@ import click
 
 from context_harness.installer import install_framework, InstallResult
 from context_harness.interfaces.cli.formatters import (
-    console,
+    get_console,
     print_header,
     print_success,
     print_warning,
@@ -43,6 +43,7 @@ def init_command(force: bool, target: str) -> None:
 
         context-harness init --force
     """
+    console = get_console()
     print_header("Installer")
 
     result = install_framework(target, force=force)
@@ -29,7 +29,7 @@ from context_harness.completion import (
     interactive_mcp_picker,
 )
 from context_harness.interfaces.cli.formatters import (
-    console,
+    get_console,
     print_header,
     print_warning,
     print_error,
@@ -92,6 +92,7 @@ def mcp_add(server: Optional[str], api_key: Optional[str], target: str) -> None:
 
         context-harness mcp add context7 --target ./my-project
     """
+    console = get_console()
     print_header("MCP Configuration")
 
     # If no server provided, show interactive picker
@@ -138,6 +139,7 @@ def mcp_list(target: str) -> None:
 
         context-harness mcp list --target ./my-project
     """
+    console = get_console()
     console.print()
     list_mcp_servers(target=target)
     console.print()
@@ -214,6 +216,7 @@ def _handle_oauth_auth(
     server: str, client_id: Optional[str], status: bool, logout: bool
 ) -> None:
     """Handle OAuth authentication for an MCP server."""
+    console = get_console()
     try:
         oauth = get_oauth_flow(server, client_id)
     except OAuthError as e:
@@ -27,7 +27,7 @@ from context_harness.completion import (
     interactive_local_skill_picker,
 )
 from context_harness.interfaces.cli.formatters import (
-    console,
+    get_console,
     print_header,
     print_error,
     print_info,
@@ -67,6 +67,7 @@ def skill_list(tags: Tuple[str, ...]) -> None:
 
         context-harness skill list --tags frontend --tags forms
     """
+    console = get_console()
     print_header("Skills")
 
     tags_list = list(tags) if tags else None
@@ -115,6 +116,7 @@ def skill_info_cmd(skill_name: str) -> None:
 
         context-harness skill info django-auth
     """
+    console = get_console()
     console.print()
     skill_data = get_skill_info(skill_name)
     if skill_data is None:
@@ -186,6 +188,7 @@ def skill_install_cmd(
 
         context-harness skill install react-forms --tool-target opencode
     """
+    console = get_console()
     import os
 
     print_header("Skill Installer")
@@ -263,6 +266,7 @@ def skill_extract_cmd(skill_name: Optional[str], source: str) -> None:
 
         context-harness skill extract react-auth --source ./my-project
     """
+    console = get_console()
     print_header("Skill Extractor")
 
     # If no skill name provided, show interactive picker
@@ -316,6 +320,7 @@ def skill_outdated_cmd(source: str) -> None:
 
         context-harness skill outdated --source ./my-project
     """
+    console = get_console()
     print_header("Skill Updates")
 
     result, comparisons = check_updates(source_path=source)
@@ -373,6 +378,7 @@ def skill_upgrade_cmd(
 
         context-harness skill upgrade react-forms --force
     """
+    console = get_console()
     print_header("Skill Upgrade")
 
     if not skill_name and not upgrade_all:
@@ -495,6 +501,7 @@ def skill_init_repo_cmd(
 
         context-harness skill init-repo my-org/skills -d "Team AI skills"
     """
+    console = get_console()
     print_header("Skill Registry Initializer")
 
     result, repo_url = init_repo(
@@ -626,7 +633,7 @@ def _configure_skills_repo_project(repo_name: str) -> None:
             skills=config.skills,
             skills_registry=SkillsRegistryConfig(default=repo_name),
             project_context=config.project_context,
-            raw_data=config.raw_data,
+            unknown=config.unknown,
         )
 
         save_result = service.save(new_config)
@@ -664,6 +671,7 @@ def skill_use_registry_cmd(url: str, project: bool) -> None:
 
         context-harness skill use-registry https://github.com/myorg/skills
     """
+    console = get_console()
     print_header("Configure Skills Registry")
 
     # Validate URL format
@@ -690,6 +698,7 @@ def skill_use_registry_cmd(url: str, project: bool) -> None:
 
 def _configure_registry_user(url: str, is_http: bool) -> None:
     """Configure registry URL in user config."""
+    console = get_console()
     try:
         from context_harness.primitives import Failure
         from context_harness.primitives.config import (
@@ -749,6 +758,7 @@ def _configure_registry_user(url: str, is_http: bool) -> None:
 
 def _configure_registry_project(url: str, is_http: bool) -> None:
     """Configure registry URL in project config."""
+    console = get_console()
     try:
         from pathlib import Path
 
@@ -789,7 +799,7 @@ def _configure_registry_project(url: str, is_http: bool) -> None:
             skills=config.skills,
             skills_registry=registry_config,
             project_context=config.project_context,
-            raw_data=config.raw_data,
+            unknown=config.unknown,
         )
 
         save_result = service.save(new_config)
@@ -856,6 +866,7 @@ def skill_upgrade_repo_cmd(
 
         context-harness skill upgrade-repo ./my-skills --force
     """
+    console = get_console()
     from pathlib import Path
 
     from context_harness.primitives import Success, Failure
@@ -13,7 +13,7 @@ import click
 from context_harness.primitives import Failure
 from context_harness.services import WorktreeService
 from context_harness.interfaces.cli.formatters import (
-    console,
+    get_console,
     print_header,
     print_warning,
     print_error,
@@ -52,6 +52,7 @@ def worktree_list(target: str) -> None:
 
         context-harness worktree list --target ./my-project
     """
+    console = get_console()
     print_header("Git Worktrees")
 
     service = WorktreeService()
@@ -113,6 +114,7 @@ def worktree_current(target: str) -> None:
 
         context-harness worktree current --target ./my-project
     """
+    console = get_console()
     service = WorktreeService()
     result = service.get_current(Path(target))
 
@@ -201,6 +203,7 @@ def worktree_add(
         # Create worktree with new branch from specific base
         context-harness worktree add ../feature-x --new-branch feature-x --base main
     """
+    console = get_console()
     print_header("Create Worktree")
 
     if branch and new_branch:
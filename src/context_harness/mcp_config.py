@@ -2,21 +2,39 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import functools
+import hashlib
+import os
+import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from context_harness import _json
 from context_harness.primitives.tool_detector import (
+    DetectedTools,
     ToolDetector,
     ToolTarget,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich is imported lazily so that importing this module (and anything that
+# pulls it in transitively) doesn't pay the rich startup cost.
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Get the shared console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 class MCPResult(Enum):
@@ -28,7 +46,7 @@ class MCPResult(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True)
 class MCPServerInfo:
     """Information about an MCP server."""
 
@@ -37,16 +55,19 @@ class MCPServerInfo:
     description: str
     server_type: str  # "remote" or "local"
     auth_type: Optional[str] = None  # "oauth", "api-key", None
+    api_key_header: Optional[str] = None  # header name carrying the API key
 
 
-# MCP Server Registry with rich metadata
-MCP_REGISTRY: List[MCPServerInfo] = [
+# MCP Server Registry with rich metadata. A tuple: the registry is
+# logically immutable, so readers can share it without defensive copies.
+MCP_REGISTRY: Tuple[MCPServerInfo, ...] = (
     MCPServerInfo(
         name="context7",
         url="https://mcp.context7.com/mcp",
         description="Documentation lookup for libraries and frameworks",
         server_type="remote",
         auth_type="api-key",
+        api_key_header="CONTEXT7_API_KEY",
     ),
     MCPServerInfo(
         name="atlassian",
@@ -62,17 +83,95 @@ MCP_REGISTRY: List[MCPServerInfo] = [
         server_type="remote",
         auth_type=None,
     ),
-]
+)
 
-# Known MCP server configurations (derived from registry for backward compatibility)
-MCP_SERVERS: Dict[str, Dict[str, Any]] = {
-    server.name: {
-        "type": server.server_type,
-        "url": server.url,
+@functools.lru_cache(maxsize=1)
+def _mcp_servers() -> Dict[str, Dict[str, Any]]:
+    """Known MCP server configurations, derived from the registry on demand."""
+    return {
+        server.name: {
+            "type": server.server_type,
+            "url": server.url,
+        }
+        for server in MCP_REGISTRY
     }
-    for server in MCP_REGISTRY
+
+
+def __getattr__(name: str) -> Any:
+    # MCP_SERVERS is kept as a module attribute for backward compatibility
+    # but built lazily so importing this module stays cheap.
+    if name == "MCP_SERVERS":
+        return _mcp_servers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_by_name() -> Dict[str, MCPServerInfo]:
+    """Name-keyed index over the registry so lookups don't scan the list."""
+    return {server.name: server for server in MCP_REGISTRY}
+
+
+# Config section holding MCP server entries, per tool config format
+_SECTION_KEYS: Dict[str, str] = {
+    "opencode": "mcp",
+    "claude-code": "mcpServers",
 }
 
+# Config filename per tool type
+_CONFIG_FILENAMES: Dict[str, str] = {
+    "opencode": "opencode.json",
+    "claude-code": ".mcp.json",
+}
+
+# Static tool_target -> tool types table; None (auto-detect) is handled in
+# _config_paths_for so callers don't each re-grow an if/elif chain.
+_TARGET_TOOL_TYPES: Dict[str, Tuple[str, ...]] = {
+    "opencode": ("opencode",),
+    "claude-code": ("claude-code",),
+    "both": ("opencode", "claude-code"),
+}
+
+
+def _config_paths_for(
+    target_path: Path, tool_target: Optional[ToolTarget]
+) -> List[Tuple[str, Path]]:
+    """Resolve which (tool_type, config_path) pairs a tool_target selects.
+
+    Args:
+        target_path: Target directory
+        tool_target: Explicit tool target, or None to auto-detect
+
+    Returns:
+        List of (tool_type, config_path) tuples; defaults to opencode when
+        auto-detection finds no installed tools
+    """
+    tool_types = _TARGET_TOOL_TYPES.get(tool_target) if tool_target else None
+    if tool_types is None:
+        detected = _detect_tools(target_path)
+        tool_types = tuple(
+            tool_type
+            for tool_type, installed in (
+                ("opencode", detected.opencode),
+                ("claude-code", detected.claude_code),
+            )
+            if installed
+        ) or ("opencode",)
+    return [
+        (tool_type, target_path / _CONFIG_FILENAMES[tool_type])
+        for tool_type in tool_types
+    ]
+
+
+@functools.lru_cache(maxsize=16)
+def _detect_tools(target_path: Path) -> DetectedTools:
+    """Detect installed tools once per target path for this process.
+
+    Detection stats the tool config directories; memoizing it means an
+    `mcp add` followed by an `mcp list` in the same process only pays for
+    the stats once.
+    """
+    return ToolDetector(target_path).detect()
+
 
 def get_opencode_config_path(target: str = ".") -> Path:
     """Get the path to the opencode.json config file.
@@ -83,7 +182,7 @@ def get_opencode_config_path(target: str = ".") -> Path:
     Returns:
         Path to opencode.json in the target directory
     """
-    return Path(target).resolve() / "opencode.json"
+    return Path(target) / "opencode.json"
 
 
 def get_mcp_json_config_path(target: str = ".") -> Path:
@@ -95,7 +194,7 @@ def get_mcp_json_config_path(target: str = ".") -> Path:
     Returns:
         Path to .mcp.json in the target directory
     """
-    return Path(target).resolve() / ".mcp.json"
+    return Path(target) / ".mcp.json"
 
 
 def get_mcp_config_paths(
@@ -119,6 +218,135 @@ def get_mcp_config_paths(
     return detector.get_mcp_config_paths(tool_target)
 
 
+# Parsed-config cache keyed by path, validated against (mtime_ns, size) so
+# the common "list then add" flow parses each tiny JSON file only once.
+# Each entry is (mtime_ns, size, parsed dict, digest of the on-disk bytes).
+_CONFIG_CACHE: Dict[Path, tuple] = {}
+
+
+def _content_digest(payload: bytes) -> bytes:
+    """Short content digest used to detect unchanged config bytes."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _read_json_config(config_path: Path) -> tuple:
+    """Load a JSON config file, reporting whether it existed.
+
+    Results are cached per path and revalidated against the file's
+    (mtime_ns, size), so repeated loads within one CLI invocation skip the
+    read and parse entirely. Callers get a deep copy and may mutate it
+    freely. The savers refresh the cache after writing.
+
+    Args:
+        config_path: Path to the JSON config file
+
+    Returns:
+        Tuple of (config dict, True if the file existed)
+    """
+    try:
+        stat = config_path.stat()
+    except OSError:
+        _CONFIG_CACHE.pop(config_path, None)
+        return {}, False
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return copy.deepcopy(cached[2]), True
+
+    try:
+        # One read() of the whole (tiny) file, then parse the flat buffer;
+        # json.load on a file object issues many small reads instead.
+        data = config_path.read_bytes()
+        config = _json.loads(data)
+    except ValueError:
+        _get_console().print(
+            f"[yellow]Warning: {config_path} contains invalid JSON, "
+            "will create backup[/yellow]"
+        )
+        return {}, True
+
+    _CONFIG_CACHE[config_path] = (
+        stat.st_mtime_ns,
+        stat.st_size,
+        copy.deepcopy(config),
+        _content_digest(data),
+    )
+    return config, True
+
+
+def _refresh_config_cache(
+    config_path: Path, config: Dict[str, Any], digest: bytes
+) -> None:
+    """Record a just-written config so the next load skips the reparse."""
+    try:
+        stat = config_path.stat()
+    except OSError:
+        _CONFIG_CACHE.pop(config_path, None)
+        return
+    _CONFIG_CACHE[config_path] = (
+        stat.st_mtime_ns,
+        stat.st_size,
+        copy.deepcopy(config),
+        digest,
+    )
+
+
+def _is_unchanged_on_disk(config_path: Path, digest: bytes) -> bool:
+    """Check whether the file already holds bytes with the given digest.
+
+    Uses the cached (mtime_ns, size, digest) so re-running an idempotent
+    save costs a stat and a 16-byte compare instead of a write.
+    """
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is None or len(cached) < 4 or cached[3] != digest:
+        return False
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return False
+    return cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size
+
+
+# Bearer tokens fetched for OAuth servers, cached per process with a short
+# TTL so repeated adds don't redo the keyring round-trip every time.
+_TOKEN_CACHE: Dict[str, Tuple[float, str]] = {}
+_TOKEN_CACHE_TTL = 300.0  # seconds
+
+
+def _cached_bearer_token(server_name: str) -> Optional[str]:
+    """Get a stored OAuth bearer token, caching hits for a short while.
+
+    Args:
+        server_name: Name of the MCP server
+
+    Returns:
+        Bearer token string, or None if no valid credentials are stored
+    """
+    cached = _TOKEN_CACHE.get(server_name)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _TOKEN_CACHE_TTL:
+        return cached[1]
+
+    from context_harness.oauth import get_mcp_bearer_token
+
+    token = get_mcp_bearer_token(server_name)
+    if token:
+        _TOKEN_CACHE[server_name] = (now, token)
+    return token
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write bytes to a sibling tempfile and swap it into place.
+
+    The single write plus os.replace keeps the target file either fully
+    old or fully new — a crash mid-save can never leave a truncated
+    config behind.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 def load_opencode_config(config_path: Path) -> Dict[str, Any]:
     """Load existing opencode.json or return default structure.
 
@@ -128,17 +356,7 @@ def load_opencode_config(config_path: Path) -> Dict[str, Any]:
     Returns:
         Parsed config dict or default structure
     """
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            console.print(
-                f"[yellow]Warning: {config_path} contains invalid JSON, "
-                "will create backup[/yellow]"
-            )
-            return {}
-    return {}
+    return _read_json_config(config_path)[0]
 
 
 def load_mcp_json_config(config_path: Path) -> Dict[str, Any]:
@@ -154,17 +372,7 @@ def load_mcp_json_config(config_path: Path) -> Dict[str, Any]:
     Returns:
         Parsed config dict or default structure
     """
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            console.print(
-                f"[yellow]Warning: {config_path} contains invalid JSON, "
-                "will create backup[/yellow]"
-            )
-            return {}
-    return {}
+    return _read_json_config(config_path)[0]
 
 
 def save_opencode_config(config_path: Path, config: Dict[str, Any]) -> None:
@@ -178,9 +386,12 @@ def save_opencode_config(config_path: Path, config: Dict[str, Any]) -> None:
     if "$schema" not in config:
         config = {"$schema": "https://opencode.ai/config.json", **config}
 
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
-        f.write("\n")  # Trailing newline
+    payload = _json.dumps_indented(config)
+    digest = _content_digest(payload)
+    if _is_unchanged_on_disk(config_path, digest):
+        return
+    _atomic_write(config_path, payload)
+    _refresh_config_cache(config_path, config, digest)
 
 
 def save_mcp_json_config(config_path: Path, config: Dict[str, Any]) -> None:
@@ -190,9 +401,12 @@ def save_mcp_json_config(config_path: Path, config: Dict[str, Any]) -> None:
         config_path: Path to .mcp.json
         config: Config dict to save
     """
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
-        f.write("\n")  # Trailing newline
+    payload = _json.dumps_indented(config)
+    digest = _content_digest(payload)
+    if _is_unchanged_on_disk(config_path, digest):
+        return
+    _atomic_write(config_path, payload)
+    _refresh_config_cache(config_path, config, digest)
 
 
 def transform_config_for_tool(
@@ -261,136 +475,111 @@ def add_mcp_server(
     Returns:
         MCPResult indicating success or failure reason
     """
-    if server_name not in MCP_SERVERS:
+    server_info = get_mcp_server_info(server_name)
+    if server_info is None:
         if not quiet:
-            console.print(f"[red]Error: Unknown MCP server '{server_name}'[/red]")
-            console.print(
-                f"[dim]Available servers: {', '.join(MCP_SERVERS.keys())}[/dim]"
+            _get_console().print(f"[red]Error: Unknown MCP server '{server_name}'[/red]")
+            _get_console().print(
+                f"[dim]Available servers: {', '.join(_registry_by_name().keys())}[/dim]"
             )
         return MCPResult.ERROR
 
     target_path = Path(target).resolve()
-    detector = ToolDetector(target_path)
 
     # Determine which config files to update
-    if tool_target == "opencode":
-        config_paths = [("opencode", get_opencode_config_path(target))]
-    elif tool_target == "claude-code":
-        config_paths = [("claude-code", get_mcp_json_config_path(target))]
-    elif tool_target == "both":
-        config_paths = [
-            ("opencode", get_opencode_config_path(target)),
-            ("claude-code", get_mcp_json_config_path(target)),
-        ]
-    else:
-        # Auto-detect based on installed tools
-        detected = detector.detect()
-        config_paths = []
-        if detected.opencode:
-            config_paths.append(("opencode", get_opencode_config_path(target)))
-        if detected.claude_code:
-            config_paths.append(("claude-code", get_mcp_json_config_path(target)))
-        # If no tools installed, default to opencode.json
-        if not config_paths:
-            config_paths = [("opencode", get_opencode_config_path(target))]
-
-    # Build the server config
-    base_config: Dict[str, Any] = MCP_SERVERS[server_name].copy()
-    if api_key and server_name == "context7":
-        base_config["headers"] = {"CONTEXT7_API_KEY": api_key}
-
-    # For OAuth-authenticated servers, try to get stored OAuth token
-    server_info = get_mcp_server_info(server_name)
-    if server_info and server_info.auth_type == "oauth":
-        try:
-            from context_harness.oauth import get_mcp_bearer_token
+    config_paths = _config_paths_for(target_path, tool_target)
 
-            token = get_mcp_bearer_token(server_name)
-            if token:
-                base_config["headers"] = {"Authorization": f"Bearer {token}"}
-                if not quiet:
-                    console.print("[green]✓ Using stored OAuth credentials[/green]")
-            else:
-                if not quiet:
-                    console.print(
-                        f"[yellow]Note: No OAuth credentials found. "
-                        f"Run 'context-harness mcp auth {server_name}' to authenticate.[/yellow]"
-                    )
-        except ImportError:
-            # OAuth module not available - proceed without token
-            pass
+    # Build the server config directly from the registry entry; no need to
+    # copy the shared MCP_SERVERS template just to extend it.
+    base_config: Dict[str, Any] = {
+        "type": server_info.server_type,
+        "url": server_info.url,
+    }
+    if api_key and server_info.api_key_header:
+        base_config["headers"] = {server_info.api_key_header: api_key}
+
+    is_oauth = server_info.auth_type == "oauth"
 
     any_updated = False
     any_created = False
 
     try:
+        # Read each target config once up front
+        loaded = []
         for tool_type, config_path in config_paths:
+            config, existed = _read_json_config(config_path)
+            loaded.append((tool_type, config_path, config, existed))
+
+        # If every target already carries this server with identical
+        # settings and no new credentials were supplied, report
+        # ALREADY_EXISTS without the OAuth import and token lookup below.
+        if api_key is None and not is_oauth:
+            if all(
+                config.get(_SECTION_KEYS[tool_type], {}).get(server_name)
+                == transform_config_for_tool(server_name, base_config, tool_type)
+                for tool_type, _config_path, config, _existed in loaded
+            ):
+                if not quiet:
+                    for _tool_type, config_path, _config, _existed in loaded:
+                        _get_console().print(
+                            f"[dim]MCP server '{server_name}' already configured "
+                            f"in {config_path.name}[/dim]"
+                        )
+                return MCPResult.ALREADY_EXISTS
+
+        # For OAuth-authenticated servers, try to get stored OAuth token
+        if is_oauth:
+            try:
+                token = _cached_bearer_token(server_name)
+                if token:
+                    base_config["headers"] = {"Authorization": f"Bearer {token}"}
+                    if not quiet:
+                        _get_console().print(
+                            "[green]✓ Using stored OAuth credentials[/green]"
+                        )
+                else:
+                    if not quiet:
+                        _get_console().print(
+                            f"[yellow]Note: No OAuth credentials found. "
+                            f"Run 'context-harness mcp auth {server_name}' to authenticate.[/yellow]"
+                        )
+            except ImportError:
+                # OAuth module not available - proceed without token
+                pass
+
+        # Both target formats differ only by section key ("mcp" vs
+        # "mcpServers") and saver, so one parameterized pass handles both.
+        savers = {
+            "opencode": save_opencode_config,
+            "claude-code": save_mcp_json_config,
+        }
+        for tool_type, config_path, config, existed in loaded:
             # Transform config for tool-specific format
             tool_config = transform_config_for_tool(server_name, base_config, tool_type)
 
-            if tool_type == "opencode":
-                # Update opencode.json format
-                config = load_opencode_config(config_path)
-                existed = config_path.exists()
-
-                # Ensure mcp section exists
-                if "mcp" not in config:
-                    config["mcp"] = {}
-
-                # Check if already configured with same settings
-                if server_name in config["mcp"]:
-                    if config["mcp"][server_name] == tool_config:
-                        if not quiet:
-                            console.print(
-                                f"[dim]MCP server '{server_name}' already configured "
-                                f"in {config_path.name}[/dim]"
-                            )
-                        continue  # Skip this config, check others
-
-                config["mcp"][server_name] = tool_config
-                save_opencode_config(config_path, config)
-
-                if existed:
-                    any_updated = True
-                else:
-                    any_created = True
+            section = config.setdefault(_SECTION_KEYS[tool_type], {})
 
+            # Check if already configured with same settings
+            if section.get(server_name) == tool_config:
                 if not quiet:
-                    console.print(
-                        f"[green]✅ Added '{server_name}' to {config_path.name}[/green]"
+                    _get_console().print(
+                        f"[dim]MCP server '{server_name}' already configured "
+                        f"in {config_path.name}[/dim]"
                     )
+                continue  # Skip this config, check others
 
-            else:  # claude-code
-                # Update .mcp.json format (uses "mcpServers" key)
-                config = load_mcp_json_config(config_path)
-                existed = config_path.exists()
-
-                # Ensure mcpServers section exists
-                if "mcpServers" not in config:
-                    config["mcpServers"] = {}
-
-                # Check if already configured with same settings
-                if server_name in config["mcpServers"]:
-                    if config["mcpServers"][server_name] == tool_config:
-                        if not quiet:
-                            console.print(
-                                f"[dim]MCP server '{server_name}' already configured "
-                                f"in {config_path.name}[/dim]"
-                            )
-                        continue  # Skip this config, check others
-
-                config["mcpServers"][server_name] = tool_config
-                save_mcp_json_config(config_path, config)
-
-                if existed:
-                    any_updated = True
-                else:
-                    any_created = True
+            section[server_name] = tool_config
+            savers[tool_type](config_path, config)
 
-                if not quiet:
-                    console.print(
-                        f"[green]✅ Added '{server_name}' to {config_path.name}[/green]"
-                    )
+            if existed:
+                any_updated = True
+            else:
+                any_created = True
+
+            if not quiet:
+                _get_console().print(
+                    f"[green]✅ Added '{server_name}' to {config_path.name}[/green]"
+                )
 
         if any_created:
             return MCPResult.SUCCESS
@@ -401,11 +590,11 @@ def add_mcp_server(
 
     except PermissionError:
         if not quiet:
-            console.print(f"[red]Error: Permission denied writing to config file[/red]")
+            _get_console().print(f"[red]Error: Permission denied writing to config file[/red]")
         return MCPResult.ERROR
     except Exception as e:
         if not quiet:
-            console.print(f"[red]Error: {e}[/red]")
+            _get_console().print(f"[red]Error: {e}[/red]")
         return MCPResult.ERROR
 
 
@@ -429,48 +618,21 @@ def list_mcp_servers(
         Dict of configured MCP servers (merged from all sources)
     """
     target_path = Path(target).resolve()
-    detector = ToolDetector(target_path)
 
     # Determine which config files to read
-    if tool_target == "opencode":
-        config_sources = [("opencode.json", get_opencode_config_path(target), "mcp")]
-    elif tool_target == "claude-code":
-        config_sources = [(".mcp.json", get_mcp_json_config_path(target), "mcpServers")]
-    elif tool_target == "both":
-        config_sources = [
-            ("opencode.json", get_opencode_config_path(target), "mcp"),
-            (".mcp.json", get_mcp_json_config_path(target), "mcpServers"),
-        ]
-    else:
-        # Auto-detect based on installed tools
-        detected = detector.detect()
-        config_sources = []
-        if detected.opencode:
-            config_sources.append(
-                ("opencode.json", get_opencode_config_path(target), "mcp")
-            )
-        if detected.claude_code:
-            config_sources.append(
-                (".mcp.json", get_mcp_json_config_path(target), "mcpServers")
-            )
-        # If no tools installed, check opencode.json anyway
-        if not config_sources:
-            config_sources = [
-                ("opencode.json", get_opencode_config_path(target), "mcp")
-            ]
+    config_sources = [
+        (config_path.name, config_path, _SECTION_KEYS[tool_type])
+        for tool_type, config_path in _config_paths_for(target_path, tool_target)
+    ]
 
     all_servers: Dict[str, Any] = {}
     any_found = False
 
     for source_name, config_path, mcp_key in config_sources:
-        if not config_path.exists():
+        config, existed = _read_json_config(config_path)
+        if not existed:
             continue
 
-        if source_name == "opencode.json":
-            config = load_opencode_config(config_path)
-        else:
-            config = load_mcp_json_config(config_path)
-
         mcp_config = config.get(mcp_key, {})
 
         if mcp_config:
@@ -481,7 +643,9 @@ def list_mcp_servers(
 
     if not quiet:
         if any_found:
-            console.print("[bold]Configured MCP servers:[/bold]")
+            # Build the listing once and print it in a single render — one
+            # markup parse and one stdout write instead of one per server.
+            lines = ["[bold]Configured MCP servers:[/bold]"]
             for name, data in all_servers.items():
                 settings = data["settings"]
                 source = data["source"]
@@ -489,11 +653,12 @@ def list_mcp_servers(
                 url = settings.get("url", settings.get("command", "N/A"))
                 has_key = "headers" in settings or "--api-key" in str(url)
                 key_indicator = " 🔑" if has_key else ""
-                console.print(
+                lines.append(
                     f"  • {name} ({server_type}){key_indicator} [dim]({source})[/dim]"
                 )
+            _get_console().print("\n".join(lines))
         else:
-            console.print("[dim]No MCP servers configured[/dim]")
+            _get_console().print("[dim]No MCP servers configured[/dim]")
 
     # Return just the server configs (without source info) for backward compat
     return {name: data["settings"] for name, data in all_servers.items()}
@@ -505,7 +670,7 @@ def get_available_servers() -> List[str]:
     Returns:
         List of server names that can be configured
     """
-    return list(MCP_SERVERS.keys())
+    return list(_mcp_servers().keys())
 
 
 def get_mcp_server_info(server_name: str) -> Optional[MCPServerInfo]:
@@ -517,33 +682,32 @@ def get_mcp_server_info(server_name: str) -> Optional[MCPServerInfo]:
     Returns:
         MCPServerInfo or None if not found
     """
-    for server in MCP_REGISTRY:
-        if server.name == server_name:
-            return server
-    return None
+    return _registry_by_name().get(server_name)
 
 
-def get_mcp_registry() -> List[MCPServerInfo]:
+def get_mcp_registry() -> Tuple[MCPServerInfo, ...]:
     """Get the full MCP server registry.
 
     Returns:
-        List of all MCPServerInfo objects
+        Tuple of all MCPServerInfo objects (read-only; do not mutate)
     """
-    return MCP_REGISTRY.copy()
+    return MCP_REGISTRY
 
 
-def list_available_mcp_servers(quiet: bool = False) -> List[MCPServerInfo]:
+def list_available_mcp_servers(quiet: bool = False) -> Tuple[MCPServerInfo, ...]:
     """List all available MCP servers that can be configured.
 
     Args:
         quiet: If True, suppress output messages
 
     Returns:
-        List of MCPServerInfo objects
+        Tuple of MCPServerInfo objects
     """
     servers = get_mcp_registry()
 
     if not quiet and servers:
+        from rich.table import Table
+
         table = Table(title="Available MCP Servers")
         table.add_column("Name", style="cyan")
         table.add_column("Description")
@@ -553,6 +717,6 @@ def list_available_mcp_servers(quiet: bool = False) -> List[MCPServerInfo]:
             auth_display = server.auth_type or "none"
             table.add_row(server.name, server.description, auth_display)
 
-        console.print(table)
+        _get_console().print(table)
 
     return servers
@@ -12,25 +12,67 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import hmac
 import http.server
 import json
 import os
+import queue
+import re
 import secrets
 import socketserver
+import tempfile
 import threading
 import time
 import urllib.parse
 import urllib.request
-import webbrowser
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
 
-from rich.console import Console
+from context_harness import _json
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich and webbrowser are imported lazily: callers that only load stored
+# tokens (e.g. get_mcp_bearer_token) never pay for them.
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Get the shared console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def _open_browser(url: str) -> None:
+    """Open the default browser, importing webbrowser on first use."""
+    import webbrowser
+
+    webbrowser.open(url)
+
+
+# Shared request-header dicts, built once instead of per request.
+# urllib.request.Request copies entries out of the dict it is given,
+# so sharing these across calls is safe.
+_FORM_POST_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "application/json",
+}
+_JSON_ACCEPT_HEADERS = {"Accept": "application/json"}
+_MCP_PROBE_HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "MCP-Protocol-Version": "2025-03-26",
+}
+
+# key="value" pairs in a WWW-Authenticate header (RFC 6750)
+_WWW_AUTH_PARAM_RE = re.compile(r'(\w+)="([^"]*)"')
 
 
 class OAuthError(Exception):
@@ -89,12 +131,18 @@ class OAuthTokens:
     scope: Optional[str] = None
     issued_at: float = field(default_factory=time.time)
 
+    def __post_init__(self) -> None:
+        # Precompute the expiry deadline (with a 60 second buffer for clock
+        # skew) so is_expired is a single compare on the hot path. Wall-clock
+        # time is kept because issued_at is persisted across processes, where
+        # a monotonic anchor would be meaningless.
+        self._expires_at: Optional[float] = (
+            None if self.expires_in is None else self.issued_at + self.expires_in - 60
+        )
+
     def is_expired(self) -> bool:
         """Check if the access token has expired."""
-        if self.expires_in is None:
-            return False
-        # Add 60 second buffer for clock skew
-        return time.time() > (self.issued_at + self.expires_in - 60)
+        return self._expires_at is not None and time.time() > self._expires_at
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -131,6 +179,15 @@ class AtlassianResource:
     avatar_url: Optional[str] = None
 
 
+def _b64url_43(data: bytes) -> str:
+    """Base64url-encode 32 bytes without padding.
+
+    A 32-byte input always encodes to 43 characters plus one ``=`` pad,
+    so slicing to a known length replaces the ``rstrip(b"=")`` tail scan.
+    """
+    return base64.urlsafe_b64encode(data)[:43].decode("ascii")
+
+
 def generate_pkce() -> PKCEChallenge:
     """Generate a PKCE code verifier and challenge.
 
@@ -139,16 +196,12 @@ def generate_pkce() -> PKCEChallenge:
     Returns:
         PKCEChallenge with verifier and challenge
     """
-    # Generate a random 32-byte (256-bit) verifier
-    # Base64url encode without padding to create a 43-character string
-    random_bytes = secrets.token_bytes(32)
-    code_verifier = base64.urlsafe_b64encode(random_bytes).rstrip(b"=").decode("ascii")
+    # 32 random bytes, base64url-encoded without padding: a 43-character
+    # verifier in one call, with no intermediate bytes objects
+    code_verifier = secrets.token_urlsafe(32)
 
     # Create SHA-256 hash of verifier and base64url encode
-    verifier_hash = hashlib.sha256(code_verifier.encode("ascii")).digest()
-    code_challenge = (
-        base64.urlsafe_b64encode(verifier_hash).rstrip(b"=").decode("ascii")
-    )
+    code_challenge = _b64url_43(hashlib.sha256(code_verifier.encode("ascii")).digest())
 
     return PKCEChallenge(
         code_verifier=code_verifier,
@@ -166,54 +219,27 @@ def generate_state() -> str:
     return secrets.token_hex(16)
 
 
-class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
-    """HTTP request handler for OAuth callback.
+def _generate_pkce_and_state() -> Tuple[PKCEChallenge, str]:
+    """Generate the PKCE challenge and CSRF state from one RNG draw.
 
-    Receives the authorization code from the OAuth provider after user authorization.
+    A single 56-byte token_urlsafe draw yields 75 url-safe characters,
+    sliced into the 43-character verifier and a 32-character state - one
+    os.urandom syscall and one base64 pass instead of two of each.
     """
+    raw = secrets.token_urlsafe(56)
+    code_verifier = raw[:43]
+    state = raw[43:75]
+    pkce = PKCEChallenge(
+        code_verifier=code_verifier,
+        code_challenge=_b64url_43(hashlib.sha256(code_verifier.encode("ascii")).digest()),
+        code_challenge_method="S256",
+    )
+    return pkce, state
 
-    # Class variables to store callback data
-    authorization_code: Optional[str] = None
-    error: Optional[str] = None
-    error_description: Optional[str] = None
-    received_state: Optional[str] = None
-    callback_received: threading.Event = threading.Event()
-
-    def log_message(self, format: str, *args: Any) -> None:
-        """Suppress HTTP server logging."""
-        pass
-
-    def do_GET(self) -> None:
-        """Handle GET request (OAuth callback)."""
-        parsed = urllib.parse.urlparse(self.path)
-        params = urllib.parse.parse_qs(parsed.query)
-
-        # Extract parameters
-        OAuthCallbackHandler.received_state = params.get("state", [None])[0]
-
-        if "error" in params:
-            OAuthCallbackHandler.error = params.get("error", ["unknown"])[0]
-            OAuthCallbackHandler.error_description = params.get(
-                "error_description", [""]
-            )[0]
-            self._send_error_response()
-        elif "code" in params:
-            OAuthCallbackHandler.authorization_code = params["code"][0]
-            self._send_success_response()
-        else:
-            OAuthCallbackHandler.error = "missing_code"
-            OAuthCallbackHandler.error_description = "No authorization code received"
-            self._send_error_response()
-
-        OAuthCallbackHandler.callback_received.set()
-
-    def _send_success_response(self) -> None:
-        """Send success HTML response."""
-        self.send_response(200)
-        self.send_header("Content-type", "text/html")
-        self.end_headers()
 
-        html = """<!DOCTYPE html>
+# Callback response pages, built once at import time. The success page is
+# static bytes; the error page only formats the error details in.
+_SUCCESS_HTML = b"""<!DOCTYPE html>
 <html>
 <head>
     <title>Authentication Successful</title>
@@ -243,25 +269,15 @@ class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
 </head>
 <body>
     <div class="container">
-        <div class="icon">✅</div>
+        <div class="icon">\xe2\x9c\x85</div>
         <h1>Authentication Successful!</h1>
         <p>You can close this window and return to your terminal.</p>
         <p class="hint">context-harness has received the authorization.</p>
     </div>
 </body>
 </html>"""
-        self.wfile.write(html.encode())
 
-    def _send_error_response(self) -> None:
-        """Send error HTML response."""
-        self.send_response(400)
-        self.send_header("Content-type", "text/html")
-        self.end_headers()
-
-        error = OAuthCallbackHandler.error or "unknown"
-        description = OAuthCallbackHandler.error_description or "An error occurred"
-
-        html = f"""<!DOCTYPE html>
+_ERROR_HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
     <title>Authentication Failed</title>
@@ -301,6 +317,85 @@ class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
     </div>
 </body>
 </html>"""
+
+
+class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP request handler for OAuth callback.
+
+    Receives the authorization code from the OAuth provider after user authorization.
+    """
+
+    # Class variables to store callback data
+    authorization_code: Optional[str] = None
+    error: Optional[str] = None
+    error_description: Optional[str] = None
+    received_state: Optional[str] = None
+    callback_received: threading.Event = threading.Event()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Suppress HTTP server logging."""
+        pass
+
+    def do_GET(self) -> None:
+        """Handle GET request (OAuth callback)."""
+        parsed = urllib.parse.urlparse(self.path)
+        # parse_qsl with a field cap bounds the parse work on junk requests;
+        # the flat dict also avoids the one-element lists parse_qs builds.
+        try:
+            params = dict(urllib.parse.parse_qsl(parsed.query, max_num_fields=8))
+        except ValueError:
+            # Too many fields - not a real OAuth redirect
+            params = {}
+
+        code = params.get("code")
+        received_state = params.get("state")
+        error = params.get("error")
+        error_description: Optional[str] = None
+
+        if error is not None:
+            error_description = params.get("error_description", "")
+        elif code is None:
+            error = "missing_code"
+            error_description = "No authorization code received"
+
+        if error is not None:
+            self._send_error_response(error, error_description)
+        else:
+            self._send_success_response()
+
+        # Queue the result on the owning server's state so concurrent flows
+        # don't clobber each other and browser retries (prefetchers, link
+        # scanners re-hitting the URL) can't overwrite an already-consumed
+        # result. Fall back to the legacy class attributes when run outside
+        # OAuthCallbackServer.
+        state = getattr(self.server, "callback_state", None)
+        if state is not None:
+            state.results.put((code, received_state, error, error_description))
+        else:
+            cls = OAuthCallbackHandler
+            cls.authorization_code = code
+            cls.received_state = received_state
+            cls.error = error
+            cls.error_description = error_description
+            cls.callback_received.set()
+
+    def _send_success_response(self) -> None:
+        """Send success HTML response."""
+        self.send_response(200)
+        self.send_header("Content-type", "text/html")
+        self.end_headers()
+        self.wfile.write(_SUCCESS_HTML)
+
+    def _send_error_response(self, error: Optional[str], description: Optional[str]) -> None:
+        """Send error HTML response."""
+        self.send_response(400)
+        self.send_header("Content-type", "text/html")
+        self.end_headers()
+
+        html = _ERROR_HTML_TEMPLATE.format(
+            error=error or "unknown",
+            description=description or "An error occurred",
+        )
         self.wfile.write(html.encode())
 
     @classmethod
@@ -313,6 +408,36 @@ class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
         cls.callback_received = threading.Event()
 
 
+@dataclass
+class _CallbackState:
+    """Callback results for a single callback server.
+
+    Keeping this per server (rather than in OAuthCallbackHandler class
+    attributes) lets multiple OAuth flows run concurrently in one process.
+    Results are delivered through a queue so only the first redirect is
+    consumed; duplicate hits on the callback URL queue behind it and are
+    simply never read.
+    """
+
+    # Tuples of (code, received_state, error, error_description)
+    results: "queue.SimpleQueue" = field(default_factory=queue.SimpleQueue)
+
+
+class _CallbackHTTPServer(http.server.ThreadingHTTPServer):
+    """Threading HTTP server for OAuth callbacks.
+
+    Handles stray browser requests (favicon, preflight) concurrently with
+    the real redirect instead of serializing them on one socket.
+    """
+
+    daemon_threads = True
+    request_queue_size = 16
+
+    def __init__(self, server_address, handler_class, state: _CallbackState):
+        super().__init__(server_address, handler_class)
+        self.callback_state = state
+
+
 class OAuthCallbackServer:
     """Local HTTP server to receive OAuth callback.
 
@@ -336,7 +461,8 @@ class OAuthCallbackServer:
         self.server: Optional[socketserver.TCPServer] = None
         self.port: Optional[int] = None
         self._thread: Optional[threading.Thread] = None
-        self._shutdown_event = threading.Event()
+        self._state: Optional[_CallbackState] = None
+        self._redirect_uri: str = ""
 
     def start(self) -> int:
         """Start the callback server on a preferred port or random port.
@@ -346,19 +472,16 @@ class OAuthCallbackServer:
         Returns:
             The port number the server is listening on
         """
+        # Legacy reset kept so the class-level fallback state stays clean
+        # for any external code still reading it.
         OAuthCallbackHandler.reset()
-        self._shutdown_event.clear()
+        self._state = _CallbackState()
 
         # Try preferred ports first
         for port in self.preferred_ports:
             try:
-                self.server = socketserver.TCPServer(
-                    ("127.0.0.1", port), OAuthCallbackHandler
-                )
-                self.server.socket.setsockopt(
-                    __import__("socket").SOL_SOCKET,
-                    __import__("socket").SO_REUSEADDR,
-                    1,
+                self.server = _CallbackHTTPServer(
+                    ("127.0.0.1", port), OAuthCallbackHandler, self._state
                 )
                 self.port = port
                 break
@@ -368,40 +491,25 @@ class OAuthCallbackServer:
 
         # Fall back to random port if all preferred ports are in use
         if self.server is None:
-            self.server = socketserver.TCPServer(("127.0.0.1", 0), OAuthCallbackHandler)
-            self.server.socket.setsockopt(
-                __import__("socket").SOL_SOCKET,
-                __import__("socket").SO_REUSEADDR,
-                1,
+            self.server = _CallbackHTTPServer(
+                ("127.0.0.1", 0), OAuthCallbackHandler, self._state
             )
             self.port = self.server.server_address[1]
 
-        # Set a socket timeout so handle_request doesn't block forever
-        self.server.socket.settimeout(1.0)
+        # Format the redirect URI once, at the point the port is known
+        self._redirect_uri = f"http://localhost:{self.port}/callback"
 
-        # Start server in background thread
-        self._thread = threading.Thread(target=self._serve, daemon=True)
+        # Serve in a background thread; serve_forever blocks in select()
+        # until shutdown() instead of waking every second to poll.
+        self._thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.5},
+            daemon=True,
+        )
         self._thread.start()
 
         return self.port
 
-    def _serve(self) -> None:
-        """Serve requests until callback received or shutdown."""
-        if not self.server:
-            return
-
-        # Poll for requests with timeout, checking shutdown event
-        while not self._shutdown_event.is_set():
-            try:
-                self.server.handle_request()
-                # If we received the callback, we're done
-                if OAuthCallbackHandler.callback_received.is_set():
-                    break
-            except Exception:
-                # Socket timeout or other error - check if we should continue
-                if self._shutdown_event.is_set():
-                    break
-
     def wait_for_callback(self, expected_state: str) -> str:
         """Wait for OAuth callback and return authorization code.
 
@@ -416,38 +524,45 @@ class OAuthCallbackServer:
             OAuthCancelledError: If user denied access
             OAuthError: If callback contains an error or state mismatch
         """
-        # Wait for callback with timeout
-        received = OAuthCallbackHandler.callback_received.wait(timeout=self.timeout)
+        state = self._state
+        if state is None:
+            raise OAuthError("Server not started")
 
-        if not received:
+        # Wait for the first callback result with timeout
+        try:
+            code, received_state, error, error_description = state.results.get(
+                timeout=self.timeout
+            )
+        except queue.Empty:
             raise OAuthTimeoutError(
                 f"OAuth callback not received within {self.timeout} seconds. "
                 "Please try again."
             )
 
         # Check for errors
-        if OAuthCallbackHandler.error:
-            if OAuthCallbackHandler.error == "access_denied":
+        if error:
+            if error == "access_denied":
                 raise OAuthCancelledError("Authorization was denied by the user.")
-            raise OAuthError(
-                f"OAuth error: {OAuthCallbackHandler.error} - "
-                f"{OAuthCallbackHandler.error_description}"
-            )
-
-        # Verify state
-        if OAuthCallbackHandler.received_state != expected_state:
+            raise OAuthError(f"OAuth error: {error} - {error_description}")
+
+        # Verify state (timing-safe compare). Compare bytes: compare_digest
+        # raises TypeError on non-ASCII str input, and received_state comes
+        # straight from the callback query string.
+        if not hmac.compare_digest(
+            (received_state or "").encode("utf-8"), expected_state.encode("utf-8")
+        ):
             raise OAuthError("State mismatch - possible CSRF attack. Please try again.")
 
-        if not OAuthCallbackHandler.authorization_code:
+        if not code:
             raise OAuthError("No authorization code received.")
 
-        return OAuthCallbackHandler.authorization_code
+        return code
 
     def stop(self) -> None:
         """Stop the callback server."""
-        self._shutdown_event.set()
         if self.server:
             try:
+                self.server.shutdown()
                 self.server.server_close()
             except Exception:
                 pass
@@ -461,7 +576,50 @@ class OAuthCallbackServer:
         """Get the redirect URI for this server."""
         if self.port is None:
             raise OAuthError("Server not started")
-        return f"http://localhost:{self.port}/callback"
+        return self._redirect_uri
+
+
+# Per-service refresh locks. Concurrent callers that hit an expired token
+# coalesce on one network refresh instead of racing the token endpoint,
+# which also avoids refresh-token rotation invalidating the losers.
+# Re-entrant so ensure_valid_token can double-check under the same lock
+# that refresh_tokens takes.
+_refresh_locks: Dict[str, threading.RLock] = {}
+_refresh_locks_guard = threading.Lock()
+
+
+def _refresh_lock(service: str) -> threading.RLock:
+    """Get (creating on first use) the refresh lock for a service."""
+    with _refresh_locks_guard:
+        lock = _refresh_locks.get(service)
+        if lock is None:
+            lock = _refresh_locks[service] = threading.RLock()
+        return lock
+
+
+# Result of the one-time keyring availability probe: (available, module).
+# The probe can hit the OS secret service (D-Bus, Keychain), so it runs at
+# most once per process rather than per TokenStorage instance.
+_keyring_probe: Optional[Tuple[bool, Any]] = None
+_keyring_probe_lock = threading.Lock()
+
+
+def _probe_keyring() -> Tuple[bool, Any]:
+    """Check once whether a functional keyring backend is available."""
+    global _keyring_probe
+    if _keyring_probe is None:
+        with _keyring_probe_lock:
+            if _keyring_probe is None:
+                try:
+                    import keyring
+
+                    # Test if keyring is functional
+                    keyring.get_password(TokenStorage.SERVICE_PREFIX, "__test__")
+                    _keyring_probe = (True, keyring)
+                except Exception:
+                    # Keyring not available or not functional
+                    _keyring_probe = (False, None)
+    return _keyring_probe
 
 
 class TokenStorage:
@@ -482,26 +640,31 @@ class TokenStorage:
         """
         self._keyring_available = False
         self._keyring = None
+        # Parsed tokens per service; save/delete keep it in sync so
+        # steady-state loads are a dict lookup instead of keyring/file I/O.
+        self._token_cache: Dict[str, OAuthTokens] = {}
+        # Token directory is created and chmod'd once, not per path lookup.
+        self._token_dir: Optional[Path] = None
+        self._token_dir_lock = threading.Lock()
 
         if use_keyring:
-            try:
-                import keyring
-
-                self._keyring = keyring
-                # Test if keyring is functional
-                self._keyring.get_password(self.SERVICE_PREFIX, "__test__")
-                self._keyring_available = True
-            except Exception:
-                # Keyring not available or not functional
-                self._keyring_available = False
+            self._keyring_available, self._keyring = _probe_keyring()
+
+    def _ensure_token_dir(self) -> Path:
+        """Create the token directory once and cache its path."""
+        if self._token_dir is None:
+            with self._token_dir_lock:
+                if self._token_dir is None:
+                    token_dir = Path.home() / self.TOKEN_DIR
+                    token_dir.mkdir(parents=True, exist_ok=True)
+                    # Set restrictive permissions on token directory
+                    token_dir.chmod(0o700)
+                    self._token_dir = token_dir
+        return self._token_dir
 
     def _get_token_path(self, service: str) -> Path:
         """Get path for file-based token storage."""
-        token_dir = Path.home() / self.TOKEN_DIR
-        token_dir.mkdir(parents=True, exist_ok=True)
-        # Set restrictive permissions on token directory
-        token_dir.chmod(0o700)
-        return token_dir / f"{service}.json"
+        return self._ensure_token_dir() / f"{service}.json"
 
     def save_tokens(self, service: str, tokens: OAuthTokens) -> None:
         """Save tokens for a service.
@@ -510,22 +673,40 @@ class TokenStorage:
             service: Service name (e.g., "atlassian")
             tokens: OAuth tokens to save
         """
-        token_data = json.dumps(tokens.to_dict())
+        token_data = _json.dumps_compact(tokens.to_dict())
+        self._token_cache[service] = tokens
 
         if self._keyring_available and self._keyring:
             try:
                 self._keyring.set_password(
-                    f"{self.SERVICE_PREFIX}-{service}", "oauth_tokens", token_data
+                    f"{self.SERVICE_PREFIX}-{service}",
+                    "oauth_tokens",
+                    token_data.decode("utf-8"),
                 )
                 return
             except Exception:
                 # Fall back to file storage
                 pass
 
-        # File-based storage
+        # File-based storage: write to a uniquely named sibling temp file
+        # (mkstemp creates it 0o600, so the token is never readable under
+        # the default umask), then atomically replace the destination.
+        # The unique name means a stale temp file left by a crashed or
+        # concurrent save never blocks later saves.
         token_path = self._get_token_path(service)
-        token_path.write_text(token_data)
-        token_path.chmod(0o600)  # Restrictive permissions
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(token_path.parent), prefix=f"{service}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(token_data)
+            os.replace(tmp_path, token_path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
     def load_tokens(self, service: str) -> Optional[OAuthTokens]:
         """Load tokens for a service.
@@ -536,6 +717,10 @@ class TokenStorage:
         Returns:
             OAuthTokens if found, None otherwise
         """
+        cached = self._token_cache.get(service)
+        if cached is not None:
+            return cached
+
         token_data: Optional[str] = None
 
         if self._keyring_available and self._keyring:
@@ -557,9 +742,11 @@ class TokenStorage:
 
         if token_data:
             try:
-                return OAuthTokens.from_dict(json.loads(token_data))
+                tokens = OAuthTokens.from_dict(json.loads(token_data))
             except (json.JSONDecodeError, KeyError):
                 return None
+            self._token_cache[service] = tokens
+            return tokens
 
         return None
 
@@ -573,6 +760,7 @@ class TokenStorage:
             True if tokens were deleted, False if not found
         """
         deleted = False
+        self._token_cache.pop(service, None)
 
         if self._keyring_available and self._keyring:
             try:
@@ -640,6 +828,10 @@ class OAuthConfig:
 # Pre-defined OAuth configurations for known providers
 OAUTH_PROVIDERS: Dict[str, "OAuthConfig"] = {}
 
+# Case-folded name -> canonical name, maintained alongside OAUTH_PROVIDERS
+# so lookups accept "Atlassian"/"ATLASSIAN" with a single dict hit.
+_PROVIDER_ALIASES: Dict[str, str] = {}
+
 
 def register_oauth_provider(config: OAuthConfig) -> None:
     """Register an OAuth provider configuration.
@@ -648,6 +840,7 @@ def register_oauth_provider(config: OAuthConfig) -> None:
         config: The OAuth configuration to register
     """
     OAUTH_PROVIDERS[config.service_name] = config
+    _PROVIDER_ALIASES[config.service_name.lower()] = config.service_name
 
 
 def get_oauth_config(
@@ -669,20 +862,15 @@ def get_oauth_config(
     if service_name not in OAUTH_PROVIDERS:
         raise OAuthError(f"Unknown OAuth provider: {service_name}")
 
-    # Create a copy with the client credentials
+    # Create a copy with the client credentials; mutable fields are copied
+    # so callers can't mutate the registered template.
     base = OAUTH_PROVIDERS[service_name]
-    return OAuthConfig(
-        service_name=base.service_name,
+    return replace(
+        base,
         client_id=client_id,
         client_secret=client_secret,
-        auth_url=base.auth_url,
-        token_url=base.token_url,
         scopes=base.scopes.copy(),
-        audience=base.audience,
-        resources_url=base.resources_url,
         extra_auth_params=base.extra_auth_params.copy(),
-        display_name=base.display_name,
-        setup_url=base.setup_url,
     )
 
 
@@ -772,6 +960,17 @@ class AtlassianOAuthFlow:
         self.callback_timeout = callback_timeout
         self._pkce: Optional[PKCEChallenge] = None
         self._state: Optional[str] = None
+        # Authorization-URL params that never change for this flow,
+        # encoded once instead of on every build_authorization_url call.
+        self._static_auth_params = urllib.parse.urlencode(
+            {
+                "audience": config.audience,
+                "client_id": config.client_id,
+                "scope": " ".join(config.scopes),
+                "response_type": "code",
+                "prompt": "consent",
+            }
+        )
 
     def get_auth_status(self) -> AuthStatus:
         """Check current authentication status.
@@ -798,23 +997,19 @@ class AtlassianOAuthFlow:
         Returns:
             Full authorization URL
         """
-        # Generate PKCE challenge
-        self._pkce = generate_pkce()
-        self._state = generate_state()
-
-        params = {
-            "audience": self.config.audience,
-            "client_id": self.config.client_id,
-            "scope": " ".join(self.config.scopes),
-            "redirect_uri": redirect_uri,
-            "state": self._state,
-            "response_type": "code",
-            "prompt": "consent",
-            "code_challenge": self._pkce.code_challenge,
-            "code_challenge_method": self._pkce.code_challenge_method,
-        }
+        # Generate PKCE challenge and CSRF state from a single RNG draw
+        self._pkce, self._state = _generate_pkce_and_state()
+
+        dynamic = urllib.parse.urlencode(
+            {
+                "redirect_uri": redirect_uri,
+                "state": self._state,
+                "code_challenge": self._pkce.code_challenge,
+                "code_challenge_method": self._pkce.code_challenge_method,
+            }
+        )
 
-        return f"{self.config.auth_url}?{urllib.parse.urlencode(params)}"
+        return f"{self.config.auth_url}?{self._static_auth_params}&{dynamic}"
 
     def exchange_code_for_tokens(self, code: str, redirect_uri: str) -> OAuthTokens:
         """Exchange authorization code for tokens.
@@ -859,16 +1054,28 @@ class AtlassianOAuthFlow:
         Raises:
             OAuthError: If refresh fails
         """
-        data = {
-            "grant_type": "refresh_token",
-            "client_id": self.config.client_id,
-            "refresh_token": refresh_token,
-        }
-
-        if self.config.client_secret:
-            data["client_secret"] = self.config.client_secret
-
-        return self._request_tokens(data)
+        with _refresh_lock("atlassian"):
+            # A concurrent caller may have finished the refresh while we
+            # waited on the lock; reuse its rotated tokens in that case.
+            current = self.storage.load_tokens("atlassian")
+            if (
+                current is not None
+                and current.refresh_token
+                and current.refresh_token != refresh_token
+                and not current.is_expired()
+            ):
+                return current
+
+            data = {
+                "grant_type": "refresh_token",
+                "client_id": self.config.client_id,
+                "refresh_token": refresh_token,
+            }
+
+            if self.config.client_secret:
+                data["client_secret"] = self.config.client_secret
+
+            return self._request_tokens(data)
 
     def _request_tokens(self, data: Dict[str, str]) -> OAuthTokens:
         """Make token request to Atlassian.
@@ -882,20 +1089,19 @@ class AtlassianOAuthFlow:
         Raises:
             OAuthError: If request fails
         """
-        encoded_data = urllib.parse.urlencode(data).encode("utf-8")
+        # urlencode output is pure ASCII (non-ASCII is percent-encoded),
+        # so the faster ASCII codec path is safe here
+        encoded_data = urllib.parse.urlencode(data).encode("ascii")
 
         request = urllib.request.Request(
             self.config.token_url,
             data=encoded_data,
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Accept": "application/json",
-            },
+            headers=_FORM_POST_HEADERS,
         )
 
         try:
             with urllib.request.urlopen(request, timeout=30) as response:
-                response_data = json.loads(response.read().decode("utf-8"))
+                response_data = _json.loads(response.read())
 
             tokens = OAuthTokens(
                 access_token=response_data["access_token"],
@@ -953,7 +1159,7 @@ class AtlassianOAuthFlow:
 
         try:
             with urllib.request.urlopen(request, timeout=30) as response:
-                resources_data = json.loads(response.read().decode("utf-8"))
+                resources_data = _json.loads(response.read())
 
             return [
                 AtlassianResource(
@@ -995,37 +1201,37 @@ class AtlassianOAuthFlow:
         """
         # Start callback server
         server = OAuthCallbackServer(timeout=self.callback_timeout)
-        port = server.start()
+        server.start()
 
         try:
             # Build authorization URL
             auth_url = self.build_authorization_url(server.redirect_uri)
 
-            console.print("\n[bold blue]🔐 Atlassian Authentication[/bold blue]\n")
+            _get_console().print("\n[bold blue]🔐 Atlassian Authentication[/bold blue]\n")
 
             if browser_callback:
                 browser_callback(auth_url)
             elif open_browser:
-                console.print("Opening browser for authentication...")
-                console.print(f"[dim]If browser doesn't open, visit:[/dim]")
-                console.print(f"[cyan]{auth_url}[/cyan]\n")
-                webbrowser.open(auth_url)
+                _get_console().print("Opening browser for authentication...")
+                _get_console().print(f"[dim]If browser doesn't open, visit:[/dim]")
+                _get_console().print(f"[cyan]{auth_url}[/cyan]\n")
+                _open_browser(auth_url)
             else:
-                console.print("Please visit this URL to authenticate:")
-                console.print(f"[cyan]{auth_url}[/cyan]\n")
+                _get_console().print("Please visit this URL to authenticate:")
+                _get_console().print(f"[cyan]{auth_url}[/cyan]\n")
 
-            console.print("[dim]Waiting for authentication...[/dim]")
+            _get_console().print("[dim]Waiting for authentication...[/dim]")
 
             # Wait for callback
             code = server.wait_for_callback(self._state or "")
 
-            console.print("[green]✓ Authorization received[/green]")
+            _get_console().print("[green]✓ Authorization received[/green]")
 
             # Exchange code for tokens
-            console.print("[dim]Exchanging code for tokens...[/dim]")
+            _get_console().print("[dim]Exchanging code for tokens...[/dim]")
             tokens = self.exchange_code_for_tokens(code, server.redirect_uri)
 
-            console.print("[green]✓ Authentication successful![/green]\n")
+            _get_console().print("[green]✓ Authentication successful![/green]\n")
 
             return tokens
 
@@ -1057,15 +1263,25 @@ class AtlassianOAuthFlow:
 
         if tokens.is_expired():
             if tokens.refresh_token:
-                console.print("[dim]Access token expired, refreshing...[/dim]")
-                try:
-                    tokens = self.refresh_tokens(tokens.refresh_token)
-                    console.print("[green]✓ Token refreshed[/green]")
-                except OAuthError:
-                    raise OAuthError(
-                        "Token refresh failed. Please re-authenticate with "
-                        "'context-harness mcp auth atlassian'"
+                with _refresh_lock("atlassian"):
+                    # Double-check inside the lock: a concurrent caller may
+                    # have refreshed while this thread waited, so reuse its
+                    # fresh tokens instead of re-posting a rotated refresh
+                    # token (which providers reject with invalid_grant).
+                    current = self.get_tokens()
+                    if current is not None and not current.is_expired():
+                        return current
+                    _get_console().print(
+                        "[dim]Access token expired, refreshing...[/dim]"
                     )
+                    try:
+                        tokens = self.refresh_tokens(tokens.refresh_token)
+                        _get_console().print("[green]✓ Token refreshed[/green]")
+                    except OAuthError:
+                        raise OAuthError(
+                            "Token refresh failed. Please re-authenticate with "
+                            "'context-harness mcp auth atlassian'"
+                        )
             else:
                 raise OAuthError(
                     "Access token expired and no refresh token available. "
@@ -1155,6 +1371,18 @@ class MCPOAuthFlow:
         self.callback_timeout = callback_timeout
         self._pkce: Optional[PKCEChallenge] = None
         self._state: Optional[str] = None
+        # Authorization-URL params that never change for this flow,
+        # encoded once instead of on every build_authorization_url call.
+        static_params = {
+            "client_id": config.client_id,
+            "scope": " ".join(config.scopes),
+            "response_type": "code",
+        }
+        # Audience is required by some providers (e.g. Atlassian)
+        if config.audience:
+            static_params["audience"] = config.audience
+        static_params.update(config.extra_auth_params)
+        self._static_auth_params = urllib.parse.urlencode(static_params)
 
     @property
     def service_name(self) -> str:
@@ -1186,28 +1414,19 @@ class MCPOAuthFlow:
         Returns:
             Full authorization URL
         """
-        # Generate PKCE challenge
-        self._pkce = generate_pkce()
-        self._state = generate_state()
-
-        params = {
-            "client_id": self.config.client_id,
-            "scope": " ".join(self.config.scopes),
-            "redirect_uri": redirect_uri,
-            "state": self._state,
-            "response_type": "code",
-            "code_challenge": self._pkce.code_challenge,
-            "code_challenge_method": self._pkce.code_challenge_method,
-        }
-
-        # Add audience if configured (required by some providers like Atlassian)
-        if self.config.audience:
-            params["audience"] = self.config.audience
-
-        # Add any extra provider-specific params
-        params.update(self.config.extra_auth_params)
+        # Generate PKCE challenge and CSRF state from a single RNG draw
+        self._pkce, self._state = _generate_pkce_and_state()
+
+        dynamic = urllib.parse.urlencode(
+            {
+                "redirect_uri": redirect_uri,
+                "state": self._state,
+                "code_challenge": self._pkce.code_challenge,
+                "code_challenge_method": self._pkce.code_challenge_method,
+            }
+        )
 
-        return f"{self.config.auth_url}?{urllib.parse.urlencode(params)}"
+        return f"{self.config.auth_url}?{self._static_auth_params}&{dynamic}"
 
     def exchange_code_for_tokens(self, code: str, redirect_uri: str) -> OAuthTokens:
         """Exchange authorization code for tokens.
@@ -1252,16 +1471,28 @@ class MCPOAuthFlow:
         Raises:
             OAuthError: If refresh fails
         """
-        data = {
-            "grant_type": "refresh_token",
-            "client_id": self.config.client_id,
-            "refresh_token": refresh_token,
-        }
-
-        if self.config.client_secret:
-            data["client_secret"] = self.config.client_secret
-
-        return self._request_tokens(data)
+        with _refresh_lock(self.service_name):
+            # A concurrent caller may have finished the refresh while we
+            # waited on the lock; reuse its rotated tokens in that case.
+            current = self.storage.load_tokens(self.service_name)
+            if (
+                current is not None
+                and current.refresh_token
+                and current.refresh_token != refresh_token
+                and not current.is_expired()
+            ):
+                return current
+
+            data = {
+                "grant_type": "refresh_token",
+                "client_id": self.config.client_id,
+                "refresh_token": refresh_token,
+            }
+
+            if self.config.client_secret:
+                data["client_secret"] = self.config.client_secret
+
+            return self._request_tokens(data)
 
     def _request_tokens(self, data: Dict[str, str]) -> OAuthTokens:
         """Make token request to OAuth provider.
@@ -1275,20 +1506,19 @@ class MCPOAuthFlow:
         Raises:
             OAuthError: If request fails
         """
-        encoded_data = urllib.parse.urlencode(data).encode("utf-8")
+        # urlencode output is pure ASCII (non-ASCII is percent-encoded),
+        # so the faster ASCII codec path is safe here
+        encoded_data = urllib.parse.urlencode(data).encode("ascii")
 
         request = urllib.request.Request(
             self.config.token_url,
             data=encoded_data,
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Accept": "application/json",
-            },
+            headers=_FORM_POST_HEADERS,
         )
 
         try:
             with urllib.request.urlopen(request, timeout=30) as response:
-                response_data = json.loads(response.read().decode("utf-8"))
+                response_data = _json.loads(response.read())
 
             tokens = OAuthTokens(
                 access_token=response_data["access_token"],
@@ -1337,40 +1567,40 @@ class MCPOAuthFlow:
         """
         # Start callback server
         server = OAuthCallbackServer(timeout=self.callback_timeout)
-        port = server.start()
+        server.start()
 
         try:
             # Build authorization URL
             auth_url = self.build_authorization_url(server.redirect_uri)
 
             display_name = self.config.display_name or self.service_name.title()
-            console.print(
+            _get_console().print(
                 f"\n[bold blue]🔐 {display_name} Authentication[/bold blue]\n"
             )
 
             if browser_callback:
                 browser_callback(auth_url)
             elif open_browser:
-                console.print("Opening browser for authentication...")
-                console.print(f"[dim]If browser doesn't open, visit:[/dim]")
-                console.print(f"[cyan]{auth_url}[/cyan]\n")
-                webbrowser.open(auth_url)
+                _get_console().print("Opening browser for authentication...")
+                _get_console().print(f"[dim]If browser doesn't open, visit:[/dim]")
+                _get_console().print(f"[cyan]{auth_url}[/cyan]\n")
+                _open_browser(auth_url)
             else:
-                console.print("Please visit this URL to authenticate:")
-                console.print(f"[cyan]{auth_url}[/cyan]\n")
+                _get_console().print("Please visit this URL to authenticate:")
+                _get_console().print(f"[cyan]{auth_url}[/cyan]\n")
 
-            console.print("[dim]Waiting for authentication...[/dim]")
+            _get_console().print("[dim]Waiting for authentication...[/dim]")
 
             # Wait for callback
             code = server.wait_for_callback(self._state or "")
 
-            console.print("[green]✓ Authorization received[/green]")
+            _get_console().print("[green]✓ Authorization received[/green]")
 
             # Exchange code for tokens
-            console.print("[dim]Exchanging code for tokens...[/dim]")
+            _get_console().print("[dim]Exchanging code for tokens...[/dim]")
             tokens = self.exchange_code_for_tokens(code, server.redirect_uri)
 
-            console.print("[green]✓ Authentication successful![/green]\n")
+            _get_console().print("[green]✓ Authentication successful![/green]\n")
 
             return tokens
 
@@ -1402,15 +1632,25 @@ class MCPOAuthFlow:
 
         if tokens.is_expired():
             if tokens.refresh_token:
-                console.print("[dim]Access token expired, refreshing...[/dim]")
-                try:
-                    tokens = self.refresh_tokens(tokens.refresh_token)
-                    console.print("[green]✓ Token refreshed[/green]")
-                except OAuthError:
-                    raise OAuthError(
-                        f"Token refresh failed. Please re-authenticate with "
-                        f"'context-harness mcp auth {self.service_name}'"
+                with _refresh_lock(self.service_name):
+                    # Double-check inside the lock: a concurrent caller may
+                    # have refreshed while this thread waited, so reuse its
+                    # fresh tokens instead of re-posting a rotated refresh
+                    # token (which providers reject with invalid_grant).
+                    current = self.get_tokens()
+                    if current is not None and not current.is_expired():
+                        return current
+                    _get_console().print(
+                        "[dim]Access token expired, refreshing...[/dim]"
                     )
+                    try:
+                        tokens = self.refresh_tokens(tokens.refresh_token)
+                        _get_console().print("[green]✓ Token refreshed[/green]")
+                    except OAuthError:
+                        raise OAuthError(
+                            f"Token refresh failed. Please re-authenticate with "
+                            f"'context-harness mcp auth {self.service_name}'"
+                        )
             else:
                 raise OAuthError(
                     "Access token expired and no refresh token available. "
@@ -1443,11 +1683,13 @@ def get_oauth_flow(
     Raises:
         OAuthError: If service not found or credentials missing
     """
-    if service_name not in OAUTH_PROVIDERS:
+    canonical = _PROVIDER_ALIASES.get(service_name.lower())
+    if canonical is None:
         raise OAuthError(
             f"Unknown OAuth provider: {service_name}. "
             f"Available providers: {', '.join(OAUTH_PROVIDERS.keys())}"
         )
+    service_name = canonical
 
     # Get client ID from environment if not provided
     if client_id is None:
@@ -1508,20 +1750,12 @@ def parse_www_authenticate(header: str) -> Dict[str, str]:
     Returns:
         Dict of parsed parameters
     """
-    params = {}
-
     # Handle "Bearer ..." format
     if header.lower().startswith("bearer "):
         header = header[7:]
 
     # Parse key="value" pairs
-    import re
-
-    pattern = r'(\w+)="([^"]*)"'
-    for match in re.finditer(pattern, header):
-        params[match.group(1)] = match.group(2)
-
-    return params
+    return {m.group(1): m.group(2) for m in _WWW_AUTH_PARAM_RE.finditer(header)}
 
 
 def discover_mcp_oauth(mcp_url: str, timeout: int = 30) -> Optional[MCPOAuthMetadata]:
@@ -1544,10 +1778,7 @@ def discover_mcp_oauth(mcp_url: str, timeout: int = 30) -> Optional[MCPOAuthMeta
         # Try to connect to the MCP endpoint
         request = urllib.request.Request(
             mcp_url,
-            headers={
-                "Accept": "application/json, text/event-stream",
-                "MCP-Protocol-Version": "2025-03-26",
-            },
+            headers=_MCP_PROBE_HEADERS,
         )
 
         try:
@@ -1570,21 +1801,36 @@ def discover_mcp_oauth(mcp_url: str, timeout: int = 30) -> Optional[MCPOAuthMeta
                 # Fetch protected resource metadata
                 return _fetch_resource_metadata(resource_metadata_url, timeout)
 
-            # Fallback: try well-known endpoint
-            base_url = _get_base_url(mcp_url)
-            well_known_url = f"{base_url}/.well-known/oauth-protected-resource"
+            # Fallback: probe both well-known endpoints concurrently.
+            # Each blocks on its own round trip, so wall time becomes the
+            # slower of the two probes instead of their sum. The protected
+            # resource metadata is still preferred; the authorization server
+            # metadata is only used when that probe fails.
+            from concurrent.futures import ThreadPoolExecutor
 
+            base_url = _get_base_url(mcp_url)
+            pool = ThreadPoolExecutor(max_workers=2)
             try:
-                return _fetch_resource_metadata(well_known_url, timeout)
-            except Exception:
-                pass
-
-            # Last resort: try authorization server metadata
-            well_known_oauth = f"{base_url}/.well-known/oauth-authorization-server"
-            try:
-                return _fetch_auth_server_metadata(well_known_oauth, timeout)
-            except Exception:
-                pass
+                resource_future = pool.submit(
+                    _fetch_resource_metadata,
+                    f"{base_url}/.well-known/oauth-protected-resource",
+                    timeout,
+                )
+                auth_future = pool.submit(
+                    _fetch_auth_server_metadata,
+                    f"{base_url}/.well-known/oauth-authorization-server",
+                    timeout,
+                )
+                try:
+                    return resource_future.result()
+                except Exception:
+                    pass
+                try:
+                    return auth_future.result()
+                except Exception:
+                    pass
+            finally:
+                pool.shutdown(wait=False)
 
             return None
 
@@ -1602,11 +1848,11 @@ def _fetch_resource_metadata(url: str, timeout: int) -> Optional[MCPOAuthMetadat
     """Fetch OAuth Protected Resource Metadata (RFC 9728)."""
     request = urllib.request.Request(
         url,
-        headers={"Accept": "application/json"},
+        headers=_JSON_ACCEPT_HEADERS,
     )
 
     with urllib.request.urlopen(request, timeout=timeout) as response:
-        data = json.loads(response.read().decode("utf-8"))
+        data = _json.loads(response.read())
 
     # Get authorization server URL
     auth_servers = data.get("authorization_servers", [])
@@ -1628,11 +1874,11 @@ def _fetch_auth_server_metadata(url: str, timeout: int) -> Optional[MCPOAuthMeta
 
     request = urllib.request.Request(
         url,
-        headers={"Accept": "application/json"},
+        headers=_JSON_ACCEPT_HEADERS,
     )
 
     with urllib.request.urlopen(request, timeout=timeout) as response:
-        data = json.loads(response.read().decode("utf-8"))
+        data = _json.loads(response.read())
 
     return MCPOAuthMetadata(
         authorization_endpoint=data.get("authorization_endpoint", ""),
@@ -1655,10 +1901,7 @@ def check_mcp_auth_required(mcp_url: str, timeout: int = 10) -> bool:
     try:
         request = urllib.request.Request(
             mcp_url,
-            headers={
-                "Accept": "application/json, text/event-stream",
-                "MCP-Protocol-Version": "2025-03-26",
-            },
+            headers=_MCP_PROBE_HEADERS,
         )
         urllib.request.urlopen(request, timeout=timeout)
         return False
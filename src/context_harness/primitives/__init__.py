@@ -10,98 +10,130 @@ Primitives follow these rules:
 3. Only standard library + typing dependencies
 4. Immutable where practical
 5. Full type annotations
+
+Submodules are imported lazily (PEP 562): importing the package is free,
+and each submodule is only parsed when one of its names is first accessed.
 """
 
-from context_harness.primitives.result import (
-    ErrorCode,
-    Failure,
-    Result,
-    Success,
-    is_failure,
-    is_success,
-)
-from context_harness.primitives.session import (
-    CompactionCycle,
-    Decision,
-    DocRef,
-    KeyFile,
-    Session,
-    SessionStatus,
-)
-from context_harness.primitives.skill import (
-    RegistryRepo,
-    RepoVisibility,
-    Skill,
-    SkillMetadata,
-    SkillSource,
-    VersionComparison,
-    VersionStatus,
-    RegistryUpgradeStatus,
-)
-from context_harness.primitives.oauth import (
-    AuthStatus,
-    OAuthConfig,
-    OAuthProvider,
-    OAuthTokens,
-    PKCEChallenge,
-)
-from context_harness.primitives.mcp import (
-    MCPAuthType,
-    MCPServer,
-    MCPServerConfig,
-    MCPServerType,
-)
-from context_harness.primitives.config import (
-    AgentConfig,
-    CommandConfig,
-    DEFAULT_SKILLS_REPO,
-    OpenCodeConfig,
-    ProjectConfig,
-    RegistryAuthConfig,
-    SKILLS_REPO_ENV_VAR,
-    SKILLS_REGISTRY_TOKEN_ENV_VAR,
-    SKILLS_REGISTRY_TYPE_ENV_VAR,
-    SKILLS_REGISTRY_URL_ENV_VAR,
-    SkillsRegistryConfig,
-    UserConfig,
-)
-from context_harness.primitives.message import (
-    Conversation,
-    Message,
-    MessagePart,
-    MessageRole,
-    MessageStatus,
-    ToolCall,
-    ToolResult,
-)
-from context_harness.primitives.voice import (
-    TranscriptionStatus,
-    VoiceRecordingState,
-    VoiceSettings,
-    VoiceSource,
-    VoiceTranscription,
-)
-from context_harness.primitives.worktree import (
-    WorktreeInfo,
-    WorktreeList,
-    WorktreeSessionId,
-)
-from context_harness.primitives.ignore import (
-    IgnoreConfig,
-    IgnoreMatch,
-    IgnorePattern,
-    IgnoreSource,
-)
-from context_harness.primitives.tool_detector import (
-    DetectedTools,
-    ToolDetector,
-    ToolPaths,
-    ToolTarget,
-    ToolType,
-    detect_tools,
-    get_all_skills_dirs,
-    get_skills_dir,
-)
+import importlib
+from typing import List
+
+# Maps each exported name to the submodule that defines it. Resolved on
+# first attribute access and cached in the module globals, so the cost of
+# parsing a submodule is paid once and only by code that uses it.
+_LAZY_SUBMODULES = {
+    "result": (
+        "ErrorCode",
+        "Failure",
+        "Result",
+        "Success",
+        "is_failure",
+        "is_success",
+    ),
+    "session": (
+        "CompactionCycle",
+        "Decision",
+        "DocRef",
+        "KeyFile",
+        "Session",
+        "SessionStatus",
+    ),
+    "skill": (
+        "RegistryRepo",
+        "RepoVisibility",
+        "Skill",
+        "SkillMetadata",
+        "SkillSource",
+        "VersionComparison",
+        "VersionStatus",
+        "RegistryUpgradeStatus",
+    ),
+    "oauth": (
+        "AuthStatus",
+        "OAuthConfig",
+        "OAuthProvider",
+        "OAuthTokens",
+        "PKCEChallenge",
+    ),
+    "mcp": (
+        "MCPAuthType",
+        "MCPServer",
+        "MCPServerConfig",
+        "MCPServerType",
+    ),
+    "config": (
+        "AgentConfig",
+        "CommandConfig",
+        "DEFAULT_SKILLS_REPO",
+        "OpenCodeConfig",
+        "ProjectConfig",
+        "RegistryAuthConfig",
+        "SKILLS_REPO_ENV_VAR",
+        "SKILLS_REGISTRY_TOKEN_ENV_VAR",
+        "SKILLS_REGISTRY_TYPE_ENV_VAR",
+        "SKILLS_REGISTRY_URL_ENV_VAR",
+        "SkillsRegistryConfig",
+        "UserConfig",
+    ),
+    "message": (
+        "Conversation",
+        "Message",
+        "MessagePart",
+        "MessageRole",
+        "MessageStatus",
+        "ToolCall",
+        "ToolResult",
+    ),
+    "voice": (
+        "TranscriptionStatus",
+        "VoiceRecordingState",
+        "VoiceSettings",
+        "VoiceSource",
+        "VoiceTranscription",
+    ),
+    "worktree": (
+        "WorktreeInfo",
+        "WorktreeList",
+        "WorktreeSessionId",
+    ),
+    "ignore": (
+        "IgnoreConfig",
+        "IgnoreMatch",
+        "IgnorePattern",
+        "IgnoreSource",
+    ),
+    "tool_detector": (
+        "DetectedTools",
+        "ToolDetector",
+        "ToolPaths",
+        "ToolTarget",
+        "ToolType",
+        "detect_tools",
+        "get_all_skills_dirs",
+        "get_skills_dir",
+    ),
+}
+
+_NAME_TO_SUBMODULE = {
+    name: submodule
+    for submodule, names in _LAZY_SUBMODULES.items()
+    for name in names
+}
+
+
+def __getattr__(name: str):
+    submodule = _NAME_TO_SUBMODULE.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{submodule}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_NAME_TO_SUBMODULE))
+
 
 __all__ = [
     # Result types
@@ -5,9 +5,11 @@ Provides dataclasses for opencode.json configuration and project paths.
 
 from __future__ import annotations
 
+import functools
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 from context_harness.primitives.mcp import MCPServerConfig
 
@@ -256,7 +258,7 @@ class OpenCodeConfig:
         skills: Skill configurations
         skills_registry: Skills registry configuration
         project_context: Path to project context file
-        raw_data: The original parsed JSON data for fields not explicitly modeled
+        unknown: Parsed JSON entries for fields not explicitly modeled
     """
 
     schema_version: str = "1.0"
@@ -266,7 +268,21 @@ class OpenCodeConfig:
     skills: Dict[str, Any] = field(default_factory=dict)
     skills_registry: Optional[SkillsRegistryConfig] = None
     project_context: Optional[str] = None
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    unknown: Dict[str, Any] = field(default_factory=dict)
+
+    # Top-level keys that from_dict maps onto typed fields; everything
+    # else is carried through in ``unknown``.
+    _KNOWN_KEYS: ClassVar[frozenset] = frozenset(
+        {
+            "$schema",
+            "mcp",
+            "agents",
+            "commands",
+            "skills",
+            "skillsRegistry",
+            "projectContext",
+        }
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> OpenCodeConfig:
@@ -278,31 +294,31 @@ class OpenCodeConfig:
         Returns:
             An OpenCodeConfig instance
         """
-        mcp_data = data.get("mcp", {})
-        mcp_servers = {}
-        for name, config in mcp_data.items():
-            if isinstance(config, dict):
-                mcp_servers[name] = MCPServerConfig.from_dict(name, config)
-
-        agents_data = data.get("agents", {})
-        agents = {}
-        for name, config in agents_data.items():
-            if isinstance(config, dict):
-                agents[name] = AgentConfig(
-                    system_prompt=config.get("systemPrompt"),
-                    tools=config.get("tools"),
-                    model=config.get("model"),
-                )
-
-        commands_data = data.get("commands", {})
-        commands = {}
-        for name, config in commands_data.items():
-            if isinstance(config, dict):
-                commands[name] = CommandConfig(
-                    description=config.get("description", ""),
-                    agent=config.get("agent"),
-                    prompt=config.get("prompt"),
-                )
+        mcp_servers = {
+            name: MCPServerConfig.from_dict(name, config)
+            for name, config in data.get("mcp", {}).items()
+            if isinstance(config, dict)
+        }
+
+        agents = {
+            name: AgentConfig(
+                system_prompt=config.get("systemPrompt"),
+                tools=config.get("tools"),
+                model=config.get("model"),
+            )
+            for name, config in data.get("agents", {}).items()
+            if isinstance(config, dict)
+        }
+
+        commands = {
+            name: CommandConfig(
+                description=config.get("description", ""),
+                agent=config.get("agent"),
+                prompt=config.get("prompt"),
+            )
+            for name, config in data.get("commands", {}).items()
+            if isinstance(config, dict)
+        }
 
         skills_registry = None
         if "skillsRegistry" in data:
@@ -316,7 +332,7 @@ class OpenCodeConfig:
             skills=data.get("skills", {}),
             skills_registry=skills_registry,
             project_context=data.get("projectContext"),
-            raw_data=data,
+            unknown={k: v for k, v in data.items() if k not in cls._KNOWN_KEYS},
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -368,6 +384,9 @@ class OpenCodeConfig:
         if self.project_context:
             result["projectContext"] = self.project_context
 
+        # Carry through fields this model doesn't know about
+        result.update(self.unknown)
+
         return result
 
 
@@ -395,6 +414,26 @@ class ProjectConfig:
         claude_md_path: Path to CLAUDE.md (Claude Code)
     """
 
+    # Pure path-holder allocated on every command invocation; slots drop
+    # the per-instance __dict__ (possible here because no field has a
+    # default, so no class attribute collides with a slot).
+    __slots__ = (
+        "project_root",
+        "context_harness_dir",
+        "opencode_dir",
+        "claude_dir",
+        "sessions_dir",
+        "templates_dir",
+        "skills_dir",
+        "claude_skills_dir",
+        "baseline_dir",
+        "project_context_path",
+        "opencode_json_path",
+        "mcp_json_path",
+        "agents_md_path",
+        "claude_md_path",
+    )
+
     project_root: Path
     context_harness_dir: Path
     opencode_dir: Path
@@ -420,26 +459,10 @@ class ProjectConfig:
         Returns:
             A ProjectConfig with all paths resolved
         """
-        context_harness_dir = project_root / ".context-harness"
-        opencode_dir = project_root / ".opencode"
-        claude_dir = project_root / ".claude"
-
-        return cls(
-            project_root=project_root,
-            context_harness_dir=context_harness_dir,
-            opencode_dir=opencode_dir,
-            claude_dir=claude_dir,
-            sessions_dir=context_harness_dir / "sessions",
-            templates_dir=context_harness_dir / "templates",
-            skills_dir=opencode_dir / "skill",  # singular for OpenCode
-            claude_skills_dir=claude_dir / "skills",  # plural for Claude Code
-            baseline_dir=context_harness_dir / "baseline",
-            project_context_path=context_harness_dir / "PROJECT-CONTEXT.md",
-            opencode_json_path=project_root / "opencode.json",
-            mcp_json_path=project_root / ".mcp.json",
-            agents_md_path=project_root / "AGENTS.md",
-            claude_md_path=project_root / "CLAUDE.md",
-        )
+        # Instances are immutable value objects, so sharing one per root
+        # is safe and repeat calls (every command touches from_cwd) skip
+        # the fourteen path constructions.
+        return _build_project_config(str(project_root))
 
     @classmethod
     def from_cwd(cls) -> ProjectConfig:
@@ -518,3 +541,34 @@ class ProjectConfig:
             Path to the SESSION.md file
         """
         return self.session_path(session_name) / "SESSION.md"
+
+
+@functools.lru_cache(maxsize=16)
+def _build_project_config(root: str) -> ProjectConfig:
+    """Build (and memoize) the ProjectConfig for a project root.
+
+    Joins on strings: Path.__truediv__ reparses parts on every join,
+    while os.path.join plus one Path() parse per result is cheaper for
+    this flat layout.
+    """
+    context_harness = os.path.join(root, ".context-harness")
+    opencode = os.path.join(root, ".opencode")
+    claude = os.path.join(root, ".claude")
+
+    return ProjectConfig(
+        project_root=Path(root),
+        context_harness_dir=Path(context_harness),
+        opencode_dir=Path(opencode),
+        claude_dir=Path(claude),
+        sessions_dir=Path(os.path.join(context_harness, "sessions")),
+        templates_dir=Path(os.path.join(context_harness, "templates")),
+        # singular for OpenCode, plural for Claude Code
+        skills_dir=Path(os.path.join(opencode, "skill")),
+        claude_skills_dir=Path(os.path.join(claude, "skills")),
+        baseline_dir=Path(os.path.join(context_harness, "baseline")),
+        project_context_path=Path(os.path.join(context_harness, "PROJECT-CONTEXT.md")),
+        opencode_json_path=Path(os.path.join(root, "opencode.json")),
+        mcp_json_path=Path(os.path.join(root, ".mcp.json")),
+        agents_md_path=Path(os.path.join(root, "AGENTS.md")),
+        claude_md_path=Path(os.path.join(root, "CLAUDE.md")),
+    )
@@ -6,10 +6,70 @@ to exclude directories and files from context scanning (similar to .gitignore).
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, List, Optional, Tuple
+
+# Built-in default patterns, shared by every IgnoreConfig instance. The
+# strings are interned so repeated loads reference one copy each.
+_DEFAULT_PATTERNS: Tuple[str, ...] = tuple(
+    sys.intern(p)
+    for p in (
+        # Version control
+        ".git/",
+        ".svn/",
+        ".hg/",
+        # Dependencies
+        "node_modules/",
+        "vendor/",
+        ".venv/",
+        "venv/",
+        "__pycache__/",
+        "*.pyc",
+        "*.pyo",
+        # Build artifacts
+        "dist/",
+        "build/",
+        ".next/",
+        ".nuxt/",
+        "out/",
+        "target/",
+        # Cache directories
+        ".pytest_cache/",
+        ".mypy_cache/",
+        ".ruff_cache/",
+        ".cache/",
+        ".parcel-cache/",
+        # IDE directories
+        ".idea/",
+        ".vscode/",
+        "*.swp",
+        "*.swo",
+        # Logs and temporary files
+        "*.log",
+        "logs/",
+        "tmp/",
+        "temp/",
+        # Coverage and test output
+        "coverage/",
+        ".coverage",
+        "htmlcov/",
+        # OS files
+        ".DS_Store",
+        "Thumbs.db",
+        # Lock files (usually large and not useful for context)
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "uv.lock",
+        "Cargo.lock",
+        "Gemfile.lock",
+        "composer.lock",
+    )
+)
 
 
 class IgnoreSource(Enum):
@@ -63,22 +123,23 @@ class IgnorePattern:
             return None
 
         # Skip comment lines
-        if stripped.startswith("#"):
+        if stripped[0] == "#":
             return None
 
-        # Handle inline comments (not standard gitignore but useful)
-        # Only if there's a space before the #
+        # Handle inline comments (not standard gitignore but useful).
+        # Only if there's a space before the #; find+slice scans once
+        # where `in` followed by split would scan twice.
         pattern = stripped
         comment = None
-        if " #" in pattern:
-            parts = pattern.split(" #", 1)
-            pattern = parts[0].rstrip()
-            comment = parts[1].strip()
-
-        # Check for negation
-        negation = False
-        if pattern.startswith("!"):
-            negation = True
+        idx = pattern.find(" #")
+        if idx >= 0:
+            comment = pattern[idx + 2 :].strip()
+            pattern = pattern[:idx].rstrip()
+
+        # Check for negation. The [:1] slice compare is safe on an empty
+        # string and skips the startswith method dispatch per line.
+        negation = pattern[:1] == "!"
+        if negation:
             pattern = pattern[1:]
 
         # Skip if pattern is now empty
@@ -110,64 +171,17 @@ class IgnoreConfig:
     source_file: Optional[Path] = None
     include_defaults: bool = True
 
-    # Default patterns that are always applied unless disabled
-    DEFAULT_PATTERNS: List[str] = field(
-        default_factory=lambda: [
-            # Version control
-            ".git/",
-            ".svn/",
-            ".hg/",
-            # Dependencies
-            "node_modules/",
-            "vendor/",
-            ".venv/",
-            "venv/",
-            "__pycache__/",
-            "*.pyc",
-            "*.pyo",
-            # Build artifacts
-            "dist/",
-            "build/",
-            ".next/",
-            ".nuxt/",
-            "out/",
-            "target/",
-            # Cache directories
-            ".pytest_cache/",
-            ".mypy_cache/",
-            ".ruff_cache/",
-            ".cache/",
-            ".parcel-cache/",
-            # IDE directories
-            ".idea/",
-            ".vscode/",
-            "*.swp",
-            "*.swo",
-            # Logs and temporary files
-            "*.log",
-            "logs/",
-            "tmp/",
-            "temp/",
-            # Coverage and test output
-            "coverage/",
-            ".coverage",
-            "htmlcov/",
-            # OS files
-            ".DS_Store",
-            "Thumbs.db",
-            # Lock files (usually large and not useful for context)
-            "package-lock.json",
-            "yarn.lock",
-            "pnpm-lock.yaml",
-            "poetry.lock",
-            "uv.lock",
-            "Cargo.lock",
-            "Gemfile.lock",
-            "composer.lock",
-        ],
-        init=False,
+    # Lazily built tuple of raw pattern strings; invalidated by
+    # add_pattern. Hashable, so matcher caches can key on it directly.
+    _raw_cache: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
     )
 
+    # Default patterns that are always applied unless disabled. A shared
+    # tuple (kept ordered - gitignore semantics are order-sensitive)
+    # instead of a fresh per-instance list.
+    DEFAULT_PATTERNS: ClassVar[Tuple[str, ...]] = _DEFAULT_PATTERNS
+
     def get_all_patterns(self) -> List[IgnorePattern]:
         """Get all patterns including defaults if enabled.
 
@@ -188,26 +202,40 @@ class IgnoreConfig:
 
         return all_patterns
 
-    def get_raw_patterns(self) -> List[str]:
-        """Get pattern strings for pathspec matching.
+    def raw_patterns(self) -> Tuple[str, ...]:
+        """Get pattern strings as a cached tuple.
+
+        Rebuilt only after add_pattern, so repeated path checks don't
+        re-derive the pattern list per call.
 
         Returns:
-            List of pattern strings in order of precedence
+            Tuple of pattern strings in order of precedence
         """
-        patterns = []
+        if self._raw_cache is None:
+            patterns = []
 
-        # Add defaults first
-        if self.include_defaults:
-            patterns.extend(self.DEFAULT_PATTERNS)
+            # Add defaults first
+            if self.include_defaults:
+                patterns.extend(self.DEFAULT_PATTERNS)
+
+            # Add explicit patterns
+            for p in self.patterns:
+                if p.negation:
+                    patterns.append(f"!{p.pattern}")
+                else:
+                    patterns.append(p.pattern)
 
-        # Add explicit patterns
-        for p in self.patterns:
-            if p.negation:
-                patterns.append(f"!{p.pattern}")
-            else:
-                patterns.append(p.pattern)
+            self._raw_cache = tuple(patterns)
 
-        return patterns
+        return self._raw_cache
+
+    def get_raw_patterns(self) -> List[str]:
+        """Get pattern strings for pathspec matching.
+
+        Returns:
+            List of pattern strings in order of precedence
+        """
+        return list(self.raw_patterns())
 
     @classmethod
     def from_file(cls, path: Path, include_defaults: bool = True) -> "IgnoreConfig":
@@ -223,15 +251,21 @@ class IgnoreConfig:
         patterns: List[IgnorePattern] = []
 
         if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    pattern = IgnorePattern.from_line(
+            # Ignore files are small; read them in one pass instead of
+            # iterating a buffered text stream line by line.
+            lines = path.read_text(encoding="utf-8").splitlines()
+            patterns = [
+                pattern
+                for line_num, line in enumerate(lines, 1)
+                if (
+                    pattern := IgnorePattern.from_line(
                         line,
                         source=IgnoreSource.CONTEXTIGNORE_FILE,
                         line_number=line_num,
                     )
-                    if pattern:
-                        patterns.append(pattern)
+                )
+                is not None
+            ]
 
         return cls(
             patterns=patterns,
@@ -252,7 +286,7 @@ class IgnoreConfig:
             source: Source of the pattern
             comment: Optional comment
         """
-        negation = pattern.startswith("!")
+        negation = pattern[:1] == "!"
         if negation:
             pattern = pattern[1:]
 
@@ -264,6 +298,7 @@ class IgnoreConfig:
                 negation=negation,
             )
         )
+        self._raw_cache = None
 
 
 @dataclass(frozen=True)
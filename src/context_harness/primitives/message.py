@@ -10,7 +10,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
-import uuid
+import itertools
+import secrets
 
 
 class MessageRole(Enum):
@@ -30,6 +31,22 @@ class MessageStatus(Enum):
     ERROR = "error"  # Error occurred
 
 
+# Pre-bound enum-to-string tables so serializers avoid a Python-level
+# `.value` attribute load per message in streaming loops.
+_ROLE_VALUES: Dict[MessageRole, str] = {role: role.value for role in MessageRole}
+
+# Process-local ID generation: a random seed drawn once at import plus a
+# cheap counter is unique enough for message/tool-call IDs and avoids a
+# full uuid4 (OS RNG read + UUID object) per ID.
+_ID_SEED = secrets.token_hex(4)
+_ID_COUNTER = itertools.count(1)
+
+
+def _new_id(prefix: str) -> str:
+    """Generate a short unique ID with the given prefix."""
+    return f"{prefix}_{_ID_SEED}{next(_ID_COUNTER):04x}"
+
+
 @dataclass
 class ToolCall:
     """A tool invocation requested by the agent.
@@ -50,7 +67,7 @@ class ToolCall:
     def create(cls, name: str, arguments: Dict[str, Any]) -> "ToolCall":
         """Create a new tool call with auto-generated ID."""
         return cls(
-            id=f"call_{uuid.uuid4().hex[:12]}",
+            id=_new_id("call"),
             name=name,
             arguments=arguments,
         )
@@ -143,7 +160,7 @@ class Message:
             A new Message instance
         """
         return cls(
-            id=f"msg_{uuid.uuid4().hex[:12]}",
+            id=_new_id("msg"),
             session_id=session_id,
             role=MessageRole.USER,
             content=content,
@@ -171,7 +188,7 @@ class Message:
             A new Message instance
         """
         return cls(
-            id=f"msg_{uuid.uuid4().hex[:12]}",
+            id=_new_id("msg"),
             session_id=session_id,
             role=MessageRole.ASSISTANT,
             content=content,
@@ -195,7 +212,7 @@ class Message:
             A new Message instance
         """
         return cls(
-            id=f"msg_{uuid.uuid4().hex[:12]}",
+            id=_new_id("msg"),
             session_id=session_id,
             role=MessageRole.SYSTEM,
             content=content,
@@ -316,7 +333,7 @@ class Conversation:
             List of role/content dicts
         """
         return [
-            {"role": m.role.value, "content": m.content}
+            {"role": _ROLE_VALUES[m.role], "content": m.content}
             for m in self.messages
             if m.status == MessageStatus.COMPLETE
         ]
@@ -60,6 +60,14 @@ class OAuthTokens:
     scope: Optional[str] = None
     issued_at: float = field(default_factory=time.time)
 
+    def __post_init__(self) -> None:
+        # Cache the absolute expiry time so is_expired is a subtract and
+        # compare instead of recomputing the sum on every check. Wall-clock
+        # time is used because issued_at is persisted across processes.
+        self._expires_at: Optional[float] = (
+            None if self.expires_in is None else self.issued_at + self.expires_in
+        )
+
     def is_expired(self, buffer_seconds: int = 60) -> bool:
         """Check if the access token has expired.
 
@@ -69,9 +77,9 @@ class OAuthTokens:
         Returns:
             True if token is expired or will expire within buffer
         """
-        if self.expires_in is None:
+        if self._expires_at is None:
             return False
-        return time.time() > (self.issued_at + self.expires_in - buffer_seconds)
+        return time.time() > (self._expires_at - buffer_seconds)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage.
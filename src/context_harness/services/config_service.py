@@ -5,10 +5,10 @@ Handles reading/writing opencode.json configuration files.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from context_harness import _json
 from context_harness.primitives import (
     ErrorCode,
     Failure,
@@ -65,11 +65,10 @@ class ConfigService:
             )
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json.loads(config_path.read_bytes())
             config = OpenCodeConfig.from_dict(data)
             return Success(value=config)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             return Failure(
                 error=f"Invalid JSON in configuration file: {e}",
                 code=ErrorCode.CONFIG_INVALID,
@@ -114,9 +113,7 @@ class ConfigService:
             if "$schema" not in data:
                 data = {"$schema": "https://opencode.ai/config.json", **data}
 
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-                f.write("\n")  # Trailing newline
+            config_path.write_bytes(_json.dumps_indented(data))
 
             return Success(value=config_path)
 
@@ -209,7 +206,7 @@ class ConfigService:
             commands=config.commands,
             skills=config.skills,
             project_context=config.project_context,
-            raw_data=config.raw_data,
+            unknown=config.unknown,
         )
 
         # Save and return
@@ -258,7 +255,7 @@ class ConfigService:
             commands=config.commands,
             skills=config.skills,
             project_context=config.project_context,
-            raw_data=config.raw_data,
+            unknown=config.unknown,
         )
 
         # Save and return
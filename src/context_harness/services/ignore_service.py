@@ -172,7 +172,7 @@ class IgnoreService:
             matcher: Custom path matcher. If None, uses PathSpecMatcher.
         """
         self._custom_matcher = matcher
-        self._cached_matchers: dict[int, PathMatcher] = {}
+        self._cached_matchers: dict[tuple[str, ...], PathMatcher] = {}
 
     def load(
         self,
@@ -241,18 +241,20 @@ class IgnoreService:
         if self._custom_matcher:
             return self._custom_matcher
 
-        # Use config's pattern list hash as cache key
-        patterns = config.get_raw_patterns()
-        cache_key = hash(tuple(patterns))
+        # The config caches its raw-pattern tuple, which doubles as the
+        # cache key, so per-path checks skip rebuilding the pattern list.
+        patterns = config.raw_patterns()
 
-        if cache_key not in self._cached_matchers:
+        matcher = self._cached_matchers.get(patterns)
+        if matcher is None:
             try:
-                self._cached_matchers[cache_key] = PathSpecMatcher(patterns)
+                matcher = PathSpecMatcher(list(patterns))
             except ImportError:
                 # Fallback to fnmatch if pathspec not available
-                self._cached_matchers[cache_key] = FnmatchMatcher(patterns)
+                matcher = FnmatchMatcher(list(patterns))
+            self._cached_matchers[patterns] = matcher
 
-        return self._cached_matchers[cache_key]
+        return matcher
 
     def should_ignore(
         self,
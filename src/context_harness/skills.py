@@ -18,11 +18,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import yaml
-from rich.console import Console
-from rich.table import Table
 
 from context_harness.primitives.tool_detector import (
     ToolDetector,
@@ -35,7 +33,23 @@ from context_harness.services.skills_registry import (
     get_registry_info,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich is imported lazily so importing this module doesn't pay the rich
+# startup cost before anything is printed.
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Get the shared console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
 
 SKILLS_REGISTRY_PATH = "skills.json"
 SKILLS_DIR = "skill"  # singular, matching OpenCode standard
@@ -103,6 +117,7 @@ def check_gh_auth(quiet: bool = False) -> bool:
     Returns:
         True if authenticated, False otherwise
     """
+    console = _get_console()
     client = get_registry_client()
     if not client.check_auth():
         if not quiet:
@@ -128,6 +143,7 @@ def check_repo_access(repo: Optional[str] = None, quiet: bool = False) -> bool:
     Returns:
         True if accessible, False otherwise
     """
+    console = _get_console()
     client = get_registry_client()
     if not client.check_access():
         if not quiet:
@@ -151,6 +167,7 @@ def get_skills_registry(quiet: bool = False) -> Optional[Dict[str, Any]]:
     Returns:
         Registry dict or None if fetch failed
     """
+    console = _get_console()
     if not check_gh_auth(quiet=quiet):
         return None
 
@@ -206,6 +223,9 @@ def list_skills(
     Returns:
         List of SkillInfo objects
     """
+    from rich.table import Table
+
+    console = _get_console()
     registry = get_skills_registry(quiet=quiet)
     if registry is None:
         return []
@@ -247,6 +267,7 @@ def get_skill_info(skill_name: str, quiet: bool = False) -> Optional[SkillInfo]:
     Returns:
         SkillInfo or None if not found
     """
+    console = _get_console()
     registry = get_skills_registry(quiet=True)
     if registry is None:
         if not quiet:
@@ -287,6 +308,7 @@ def _fetch_directory_recursive(
     Returns:
         True if successful, False otherwise
     """
+    console = _get_console()
     client = get_registry_client()
     try:
         success = client.fetch_directory(path, dest)
@@ -324,6 +346,7 @@ def install_skill(
     Returns:
         SkillResult indicating success or failure
     """
+    console = _get_console()
     # Get skill info
     skill = get_skill_info(skill_name, quiet=True)
     if skill is None:
@@ -441,6 +464,7 @@ def init_repo(
     Returns:
         Tuple of (SkillResult, repo URL or None)
     """
+    console = _get_console()
     from context_harness.services.skill_service import SkillService
     from context_harness.primitives import Success, Failure, ErrorCode
 
@@ -512,6 +536,7 @@ def upgrade_repo(
     Returns:
         Tuple of (SkillResult, upgrade details dict or None)
     """
+    console = _get_console()
     from context_harness.services.skill_service import SkillService
     from context_harness.primitives import Success, Failure
 
@@ -572,6 +597,7 @@ def _validate_skill(skill_path: Path, quiet: bool = False) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    console = _get_console()
     skill_md = skill_path / "SKILL.md"
     if not skill_md.exists():
         if not quiet:
@@ -682,6 +708,7 @@ def extract_skill(
     Returns:
         Tuple of (SkillResult, PR URL or None)
     """
+    console = _get_console()
     # Validate skill name contains only safe characters
     if not _validate_skill_name(skill_name):
         if not quiet:
@@ -952,6 +979,9 @@ def list_local_skills(
     Returns:
         List of LocalSkillInfo objects
     """
+    from rich.table import Table
+
+    console = _get_console()
     source = Path(source_path).resolve()
     detector = ToolDetector(source)
 
@@ -1231,6 +1261,9 @@ def check_updates(
     Returns:
         Tuple of (SkillResult, list of VersionComparison objects or None)
     """
+    from rich.table import Table
+
+    console = _get_console()
     from pathlib import Path as _Path
     from context_harness.services.skill_service import SkillService
     from context_harness.primitives import Success, Failure
@@ -1300,6 +1333,7 @@ def upgrade_skill(
     Returns:
         SkillResult indicating success or failure
     """
+    console = _get_console()
     from pathlib import Path as _Path
     from context_harness.services.skill_service import SkillService
     from context_harness.primitives import Success, Failure, ErrorCode
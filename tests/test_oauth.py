@@ -250,6 +250,23 @@ class TestTokenStorage:
                 assert loaded is not None
                 assert loaded.access_token == "test_token"
 
+    def test_storage_save_ignores_stale_temp_file(self):
+        """Test that a leftover temp file from a crashed save doesn't block saving."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(Path, "home", return_value=Path(tmpdir)):
+                storage = TokenStorage(use_keyring=False)
+
+                token_dir = Path(tmpdir) / ".context-harness" / "tokens"
+                token_dir.mkdir(parents=True)
+                (token_dir / "atlassian.tmp").write_text("stale")
+
+                tokens = OAuthTokens(access_token="test_token", expires_in=3600)
+                storage.save_tokens("atlassian", tokens)
+
+                loaded = storage.load_tokens("atlassian")
+                assert loaded is not None
+                assert loaded.access_token == "test_token"
+
     def test_storage_delete_tokens(self):
         """Test that tokens can be deleted."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -80,7 +80,7 @@ class TestOpenCodeConfig:
         assert config.commands == {}
         assert config.skills == {}
         assert config.project_context is None
-        assert config.raw_data == {}
+        assert config.unknown == {}
 
     def test_from_dict_empty(self):
         """Test parsing empty dict."""
@@ -150,16 +150,16 @@ class TestOpenCodeConfig:
         assert config.commands["test"].agent == "test-agent"
         assert config.commands["test"].prompt == "Run pytest"
 
-    def test_from_dict_preserves_raw_data(self):
-        """Test that raw_data preserves original dict."""
+    def test_from_dict_preserves_unknown_fields(self):
+        """Test that unmodeled fields survive a from_dict/to_dict round trip."""
         data = {
             "$schema": "https://opencode.ai/schema.json",
             "mcp": {"test": {"url": "http://test.com"}},
             "customField": "custom value",
         }
         config = OpenCodeConfig.from_dict(data)
-        assert config.raw_data == data
-        assert config.raw_data["customField"] == "custom value"
+        assert config.unknown == {"customField": "custom value"}
+        assert config.to_dict()["customField"] == "custom value"
 
     def test_to_dict_roundtrip(self):
         """Test that to_dict produces valid config for MCP."""